@@ -11,12 +11,15 @@ Key Variables:
 - `DB_USER`: The database username.
 - `DB_PASSWORD`: The database password.
 - `DB_NAME`: The database name.
+- `DB_POOL_MIN_CACHED` / `DB_POOL_MAX_CACHED` / `DB_POOL_MAX_CONNECTIONS`: Sizing for
+  the shared MySQL connection pool used by raw-SQL services.
 
 Inter-script Communication:
 - This script is imported by all other Python scripts that need to interact with the database.
 """
 
 import os
+import threading
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -44,6 +47,55 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Create base class for models
 Base = declarative_base()
 
+# Shared MySQL connection pool for services that use raw SQL (S3 upload/migration).
+# Created lazily on first use so importing a service does not require a live database,
+# DBUtils or a raw-SQL driver - only the services that use the pool need them.
+_mysql_pool = None
+_mysql_pool_lock = threading.Lock()
+
+def _get_mysql_driver():
+    """Raw-SQL driver for the pool: mysqlclient (C, faster row fetching) if installed, else PyMySQL"""
+    try:
+        import MySQLdb
+        import MySQLdb.cursors
+        return MySQLdb
+    except ImportError:
+        import pymysql
+        import pymysql.cursors
+        return pymysql
+
+def get_mysql_pool():
+    """Get the process-wide MySQL connection pool"""
+    global _mysql_pool
+    if _mysql_pool is None:
+        with _mysql_pool_lock:
+            if _mysql_pool is None:
+                from dbutils.pooled_db import PooledDB
+                
+                _mysql_pool = PooledDB(
+                    creator=_get_mysql_driver(),
+                    mincached=int(os.getenv('DB_POOL_MIN_CACHED', '2')),
+                    maxcached=int(os.getenv('DB_POOL_MAX_CACHED', '10')),
+                    maxconnections=int(os.getenv('DB_POOL_MAX_CONNECTIONS', '20')),
+                    blocking=True,
+                    ping=1,
+                    host=DB_HOST,
+                    port=int(DB_PORT),
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    database=DB_NAME,
+                    charset='utf8mb4'
+                )
+    return _mysql_pool
+
+def get_pooled_connection():
+    """Get a pooled MySQL connection; close() returns it to the pool"""
+    return get_mysql_pool().connection()
+
+def dict_cursor(connection):
+    """Open a cursor returning rows as dicts on a pooled connection"""
+    return connection.cursor(_get_mysql_driver().cursors.DictCursor)
+
 def get_db():
     """Get database session"""
     db = SessionLocal()
@@ -1,8 +1,8 @@
 """
 Defines the SQLAlchemy ORM models for the RadioGrab application.
 
-This script contains the database schema for `Station`, `Show`, `Recording`, and
-`CronJob` entities. These models represent the core data structures of the application
+This script contains the database schema for `Station`, `Show`, `Recording`,
+`CronJob`, and `ScheduleChange` entities. These models represent the core data structures of the application
 and are used by various services to interact with the database.
 
 Key Models:
@@ -10,6 +10,7 @@ Key Models:
 - `Show`: Represents a radio show with its schedule, metadata, and associated station.
 - `Recording`: Represents a recorded audio file, linked to a specific show.
 - `CronJob`: Represents a scheduled cron job for recordings.
+- `ScheduleChange`: A show change found by schedule verification.
 
 Inter-script Communication:
 - This script is imported by all other Python scripts that need to interact with the database models.
@@ -32,6 +33,8 @@ class Station(Base):
     logo_url = Column(String(500), nullable=True)
     calendar_url = Column(String(500), nullable=True)
     calendar_parsing_method = Column(Text, nullable=True)
+    calendar_etag = Column(String(255), nullable=True)              # Calendar page ETag from last verification
+    calendar_last_modified = Column(String(64), nullable=True)      # Calendar page Last-Modified from last verification
     status = Column(String(50), default='active')
     
     # Stream testing fields
@@ -78,6 +81,7 @@ class Show(Base):
     retention_days = Column(Integer, default=30)  # 0 = never expire (for playlists)
     audio_format = Column(String(10), default='mp3')
     active = Column(Boolean, default=True)
+    tags = Column(Text, nullable=True)  # Comma-separated tags for show categorization
     
     # Upload/playlist specific fields
     allow_uploads = Column(Boolean, default=False)  # Allow user uploads to this show
@@ -132,4 +136,21 @@ class CronJob(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    show = relationship("Show", back_populates="cron_jobs")
\ No newline at end of file
+    show = relationship("Show", back_populates="cron_jobs")
+
+class ScheduleChange(Base):
+    __tablename__ = "schedule_changes"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    verified_at = Column(DateTime(timezone=True), nullable=False, index=True)  # Verification run time
+    station_id = Column(Integer, ForeignKey("stations.id"), nullable=False)
+    change_type = Column(String(20), nullable=False)  # 'added', 'updated' or 'removed'
+    show_name = Column(String(255), nullable=False)
+    old_schedule = Column(String(255), nullable=True)
+    new_schedule = Column(String(255), nullable=True)
+    old_description = Column(String(500), nullable=True)
+    new_description = Column(String(500), nullable=True)
+    reason = Column(String(255), nullable=True)
+    
+    # Relationships
+    station = relationship("Station")
@@ -161,6 +161,44 @@ class CalendarParser:
             logger.error(f"Error parsing station schedule from {station_url}: {e}")
             return []
     
+    def check_calendar_modified(self, calendar_url: str, etag: Optional[str] = None,
+                                last_modified: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Conditional HEAD request for a calendar page
+        
+        Returns:
+            Dictionary with 'not_modified' and the page's current 'etag' / 'last_modified'
+            validators, or None if the request failed
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        try:
+            response = self.session.head(calendar_url, headers=headers, timeout=self.timeout,
+                                         allow_redirects=True)
+            if response.status_code not in (200, 304):
+                return None
+            
+            if response.status_code == 304 and headers:
+                # A 304 may omit the validators, in which case the stored ones still apply
+                return {
+                    'not_modified': True,
+                    'etag': response.headers.get('ETag', etag),
+                    'last_modified': response.headers.get('Last-Modified', last_modified)
+                }
+            
+            return {
+                'not_modified': False,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+        except requests.RequestException as e:
+            logger.debug(f"Conditional request failed for {calendar_url}: {e}")
+            return None
+    
     def _discover_schedule_urls(self, station_url: str) -> List[str]:
         """Find potential schedule/programming pages on the station website"""
         urls_to_try = [station_url]
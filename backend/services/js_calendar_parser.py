@@ -27,6 +27,7 @@ import json
 import logging
 import time
 import os
+import threading
 from datetime import datetime, time as dt_time, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from urllib.parse import urljoin, urlparse
@@ -49,6 +50,9 @@ from backend.services.calendar_parser import CalendarParser, ShowSchedule
 
 logger = logging.getLogger(__name__)
 
+# Serializes WebDriver setup across threads (see _get_webdriver)
+_DRIVER_INIT_LOCK = threading.Lock()
+
 
 class JavaScriptCalendarParser(CalendarParser):
     """Enhanced calendar parser with JavaScript execution capabilities"""
@@ -142,33 +146,36 @@ class JavaScriptCalendarParser(CalendarParser):
                     logger.warning("No Chrome/Chromium browser found, WebDriver will fail")
                     raise Exception("No compatible browser found for WebDriver")
                 
-                # First, try using system chromedriver
-                import shutil
-                system_chromedriver = shutil.which('chromedriver')
+                # Driver setup may swap the process-wide HOME for webdriver-manager, so parsers
+                # running in worker threads set up their drivers one at a time
+                with _DRIVER_INIT_LOCK:
+                    # First, try using system chromedriver
+                    import shutil
+                    system_chromedriver = shutil.which('chromedriver')
                 
-                if system_chromedriver:
-                    logger.info(f"Using system chromedriver: {system_chromedriver}")
-                    service = Service(system_chromedriver)
-                else:
-                    # Fallback to webdriver manager with environment variable
-                    import os
+                    if system_chromedriver:
+                        logger.info(f"Using system chromedriver: {system_chromedriver}")
+                        service = Service(system_chromedriver)
+                    else:
+                        # Fallback to webdriver manager with environment variable
+                        import os
                     
-                    # Set home directory for webdriver manager to a writable location
-                    original_home = os.environ.get('HOME')
-                    os.environ['HOME'] = '/var/radiograb/temp'
+                        # Set home directory for webdriver manager to a writable location
+                        original_home = os.environ.get('HOME')
+                        os.environ['HOME'] = '/var/radiograb/temp'
                     
-                    try:
-                        cache_dir = "/var/radiograb/temp/.wdm"
-                        os.makedirs(cache_dir, exist_ok=True)
-                        service = Service(ChromeDriverManager().install())
-                    finally:
-                        # Restore original HOME if it existed
-                        if original_home:
-                            os.environ['HOME'] = original_home
-                        else:
-                            os.environ.pop('HOME', None)
+                        try:
+                            cache_dir = "/var/radiograb/temp/.wdm"
+                            os.makedirs(cache_dir, exist_ok=True)
+                            service = Service(ChromeDriverManager().install())
+                        finally:
+                            # Restore original HOME if it existed
+                            if original_home:
+                                os.environ['HOME'] = original_home
+                            else:
+                                os.environ.pop('HOME', None)
                 
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 self.driver.set_page_load_timeout(self.timeout)
                 
             except Exception as e:
@@ -48,7 +48,7 @@ sys.path.insert(0, '/opt/radiograb')
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, load_only
 from backend.config.database import SessionLocal
 from backend.models.station import Station, Show, Recording
 
@@ -429,22 +429,27 @@ class RecordingScheduler:
         
         db = SessionLocal()
         try:
-            active_shows = db.query(Show).filter(Show.active == True).all()
-            logger.info(f"Found {len(active_shows)} active shows to schedule")
+            # Load shows with their stations in one query, streamed in batches; only the
+            # columns scheduling reads are fetched
+            active_shows = db.query(Show).options(
+                load_only(Show.id, Show.name, Show.active, Show.schedule_pattern),
+                joinedload(Show.station).load_only(Station.stream_url)
+            ).filter(
+                Show.active == True,
+                Show.schedule_pattern.isnot(None),
+                Show.schedule_pattern != ''
+            ).yield_per(500)
             
             for show in active_shows:
-                if show.schedule_pattern:
-                    schedule_result = self.schedule_show(show.id)
-                    if schedule_result['success']:
-                        result['scheduled_count'] += 1
-                        logger.info(f"Scheduled: {show.name} (next: {schedule_result['next_run']})")
-                    else:
-                        result['failed_count'] += 1
-                        error_msg = f"Failed to schedule {show.name}: {schedule_result['error']}"
-                        result['errors'].append(error_msg)
-                        logger.error(error_msg)
+                schedule_result = self.schedule_loaded_show(show)
+                if schedule_result['success']:
+                    result['scheduled_count'] += 1
+                    logger.info(f"Scheduled: {show.name} (next: {schedule_result['next_run']})")
                 else:
-                    logger.warning(f"Show '{show.name}' has no schedule pattern")
+                    result['failed_count'] += 1
+                    error_msg = f"Failed to schedule {show.name}: {schedule_result['error']}"
+                    result['errors'].append(error_msg)
+                    logger.error(error_msg)
         
         finally:
             db.close()
@@ -454,78 +459,88 @@ class RecordingScheduler:
         
         return result
     
-    def schedule_show(self, show_id: int) -> Dict[str, Any]:
-        """Schedule a single show"""
+    def schedule_show(self, show_id: int, session: Optional[Session] = None) -> Dict[str, Any]:
+        """Schedule a single show (using the caller's session if given)"""
+        db = session or SessionLocal()
+        try:
+            show = db.query(Show).filter(Show.id == show_id).first()
+            if not show:
+                return {
+                    'success': False,
+                    'job_id': None,
+                    'next_run': None,
+                    'error': f"Show {show_id} not found"
+                }
+            
+            return self.schedule_loaded_show(show)
+        
+        finally:
+            if session is None:
+                db.close()
+    
+    def schedule_loaded_show(self, show: Show) -> Dict[str, Any]:
+        """Schedule a show that has already been loaded (its session must still be open)"""
         result = {
             'success': False,
             'job_id': None,
             'next_run': None,
             'error': None
         }
+        show_id = show.id
         
-        db = SessionLocal()
+        if not show.active:
+            result['error'] = f"Show {show_id} is not active"
+            return result
+        
+        if not show.schedule_pattern:
+            result['error'] = f"Show {show_id} has no schedule pattern"
+            return result
+        
+        station = show.station
+        if not station or not station.stream_url:
+            result['error'] = f"Show {show_id} has no valid station or stream URL"
+            return result
+        
+        # Parse cron schedule pattern
         try:
-            show = db.query(Show).filter(Show.id == show_id).first()
-            if not show:
-                result['error'] = f"Show {show_id} not found"
+            cron_parts = show.schedule_pattern.strip().split()
+            if len(cron_parts) != 5:
+                result['error'] = f"Invalid cron pattern: {show.schedule_pattern} (must have 5 parts)"
                 return result
             
-            if not show.active:
-                result['error'] = f"Show {show_id} is not active"
-                return result
+            minute, hour, day, month, day_of_week = cron_parts
             
-            if not show.schedule_pattern:
-                result['error'] = f"Show {show_id} has no schedule pattern"
-                return result
+            trigger = CronTrigger(
+                minute=minute,
+                hour=hour,
+                day=day,
+                month=month,
+                day_of_week=day_of_week,
+                timezone='America/New_York'  # Use system timezone
+            )
             
-            station = show.station
-            if not station or not station.stream_url:
-                result['error'] = f"Show {show_id} has no valid station or stream URL"
-                return result
+            job_id = f"show_{show_id}_recording"
+            
+            # Schedule the job
+            job = self.scheduler.add_job(
+                func=self._recording_job,
+                trigger=trigger,
+                args=[show_id],
+                id=job_id,
+                name=f"Record {show.name}",
+                replace_existing=True,
+                max_instances=1  # Prevent overlapping recordings
+            )
             
-            # Parse cron schedule pattern
-            try:
-                cron_parts = show.schedule_pattern.strip().split()
-                if len(cron_parts) != 5:
-                    result['error'] = f"Invalid cron pattern: {show.schedule_pattern} (must have 5 parts)"
-                    return result
-                
-                minute, hour, day, month, day_of_week = cron_parts
-                
-                trigger = CronTrigger(
-                    minute=minute,
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    day_of_week=day_of_week,
-                    timezone='America/New_York'  # Use system timezone
-                )
-                
-                job_id = f"show_{show_id}_recording"
-                
-                # Schedule the job
-                job = self.scheduler.add_job(
-                    func=self._recording_job,
-                    trigger=trigger,
-                    args=[show_id],
-                    id=job_id,
-                    name=f"Record {show.name}",
-                    replace_existing=True,
-                    max_instances=1  # Prevent overlapping recordings
-                )
-                
-                result.update({
-                    'success': True,
-                    'job_id': job_id,
-                    'next_run': job.next_run_time.isoformat() if job.next_run_time else None
-                })
-                
-            except Exception as e:
-                result['error'] = f"Scheduling error: {str(e)}"
-                logger.error(f"Error scheduling show {show_id}: {str(e)}")
-        
-        finally:
-            db.close()
+            result.update({
+                'success': True,
+                'job_id': job_id,
+                'next_run': job.next_run_time.isoformat() if job.next_run_time else None
+            })
+            
+        except Exception as e:
+            result['error'] = f"Scheduling error: {str(e)}"
+            logger.error(f"Error scheduling show {show_id}: {str(e)}")
         
         return result
     
@@ -576,6 +591,14 @@ class RecordingScheduler:
             logger.warning(f"Job {job_id} not found or error unscheduling: {str(e)}")
             return False
     
+    def unschedule_all_shows(self) -> int:
+        """Remove all scheduled recording jobs with a single jobstore call"""
+        # Only show recording jobs are ever added to this scheduler
+        count = len(self.scheduler.get_jobs())
+        self.scheduler.remove_all_jobs()
+        logger.info(f"Unscheduled {count} recording jobs")
+        return count
+    
     def get_scheduled_jobs(self) -> List[Dict]:
         """Get list of all scheduled recording jobs"""
         jobs = []
@@ -498,4 +498,4 @@ if __name__ == "__main__":
         print(f"Feed update for show {show_id}: {'Success' if success else 'Failed'}")
     else:
         results = manager.update_all_feeds()
-        print(f"Updated feeds: {len([r for r in results.values() if r])}/{len(results)}")
\ No newline at end of file
+        print(f"Updated feeds: {sum(1 for r in results.values() if r)}/{len(results)}")
\ No newline at end of file
@@ -8,16 +8,20 @@ import os
 import sys
 import json
 import logging
-import pymysql
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# Import S3 upload service
-from s3_upload_service_fixed import S3UploadService
+# Import S3 upload service and shared connection pool
+from backend.config.database import dict_cursor, get_pooled_connection
+from backend.services.s3_upload_service import S3UploadService, date_prefix
 
 # Configure logging
 logging.basicConfig(
@@ -26,30 +30,106 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class SyncStatusCache:
+    """On-disk (sqlite) record of recordings already uploaded to S3
+    
+    Keeps (user_id, recording_id) pairs plus the last user_api_usage_log ID seen per user,
+    so repeat runs only read new log rows from MySQL. Any sqlite error degrades to an
+    empty cache, which makes callers fall back to a full MySQL lookup.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS migrated (
+                    user_id INTEGER NOT NULL,
+                    recording_id INTEGER NOT NULL,
+                    uploaded_at INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, recording_id)
+                );
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    user_id INTEGER PRIMARY KEY,
+                    last_log_id INTEGER NOT NULL
+                );
+            """)
+        return self._conn
+    
+    def get_migrated_ids(self, user_id: int) -> Set[int]:
+        """Get cached migrated recording IDs for a user"""
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT recording_id FROM migrated WHERE user_id = ?", (user_id,)
+                ).fetchall()
+            return {row[0] for row in rows}
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Sync status cache unavailable: {str(e)}")
+            return set()
+    
+    def get_last_log_id(self, user_id: int) -> int:
+        """Get the highest user_api_usage_log ID already folded into the cache"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT last_log_id FROM sync_state WHERE user_id = ?", (user_id,)
+                ).fetchone()
+            return row[0] if row else 0
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Sync status cache unavailable: {str(e)}")
+            return 0
+    
+    def add(self, user_id: int, recording_ids, last_log_id: Optional[int] = None) -> None:
+        """Record recordings as migrated, optionally advancing the log high-water mark"""
+        now = int(time.time())
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO migrated (user_id, recording_id, uploaded_at) VALUES (?, ?, ?)",
+                        [(user_id, recording_id, now) for recording_id in recording_ids]
+                    )
+                    if last_log_id is not None:
+                        conn.execute("""
+                            INSERT INTO sync_state (user_id, last_log_id) VALUES (?, ?)
+                            ON CONFLICT(user_id) DO UPDATE SET last_log_id = MAX(last_log_id, excluded.last_log_id)
+                        """, (user_id, last_log_id))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to update sync status cache: {str(e)}")
+
 class S3MigrationService:
     def __init__(self):
         self.s3_service = S3UploadService()
         self.recordings_dir = os.environ.get('RECORDINGS_DIR', '/var/radiograb/recordings')
-        
-        # Database connection
-        self.db_config = {
-            'host': os.environ.get('DB_HOST', 'mysql'),
-            'port': int(os.environ.get('DB_PORT', '3306')),
-            'user': os.environ.get('DB_USER', 'radiograb'),
-            'password': os.environ.get('DB_PASSWORD', 'radiograb_pass_2024'),
-            'database': os.environ.get('DB_NAME', 'radiograb'),
-            'charset': 'utf8mb4'
-        }
+        self.sync_cache = SyncStatusCache(
+            os.environ.get('S3_SYNC_CACHE_PATH', '/var/radiograb/cache/migrated.sqlite')
+        )
     
     def get_db_connection(self):
-        """Get database connection"""
-        return pymysql.connect(**self.db_config)
+        """Get pooled database connection (close() returns it to the pool)"""
+        return get_pooled_connection()
+    
+    def _scan_local_files(self) -> Dict[str, int]:
+        """Map filename -> size for every file in the recordings directory (single directory read)"""
+        try:
+            with os.scandir(self.recordings_dir) as entries:
+                return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            logger.warning(f"Recordings directory not found: {self.recordings_dir}")
+            return {}
     
     def get_user_recordings(self, user_id: int, limit: Optional[int] = None) -> List[Dict]:
         """Get all recordings for a user that exist locally"""
         connection = self.get_db_connection()
         try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
+            with dict_cursor(connection) as cursor:
                 query = """
                     SELECT r.*, s.name as show_name, st.call_letters
                     FROM recordings r
@@ -66,19 +146,22 @@ class S3MigrationService:
                 
                 cursor.execute(query, params)
                 recordings = cursor.fetchall()
-                
-                # Filter for recordings that exist locally
-                existing_recordings = []
-                for recording in recordings:
-                    local_path = os.path.join(self.recordings_dir, recording['filename'])
-                    if os.path.exists(local_path):
-                        recording['local_path'] = local_path
-                        recording['file_size'] = os.path.getsize(local_path)
-                        existing_recordings.append(recording)
-                
-                return existing_recordings
         finally:
+            # Return the connection before touching the filesystem
             connection.close()
+        
+        # Filter for recordings that exist locally
+        local_files = self._scan_local_files()
+        existing_recordings = []
+        for recording in recordings:
+            file_size = local_files.get(recording['filename'])
+            if file_size is None:
+                continue
+            recording['local_path'] = os.path.join(self.recordings_dir, recording['filename'])
+            recording['file_size'] = file_size
+            existing_recordings.append(recording)
+        
+        return existing_recordings
     
     def is_recording_migrated(self, user_id: int, recording_id: int) -> bool:
         """Check if a recording has already been migrated to S3"""
@@ -86,41 +169,88 @@ class S3MigrationService:
         try:
             with connection.cursor() as cursor:
                 cursor.execute("""
-                    SELECT COUNT(*) as count
+                    SELECT 1
                     FROM user_api_usage_log 
                     WHERE user_id = %s 
                     AND service_type = 's3_storage' 
                     AND operation_type = 'upload' 
                     AND success = 1
                     AND resource_type = 'recording'
-                    AND resource_id LIKE %s
-                """, [user_id, f'%_{recording_id}'])
+                    AND resource_id = %s
+                    LIMIT 1
+                """, [user_id, recording_id])
                 
-                result = cursor.fetchone()
-                return result[0] > 0
+                return cursor.fetchone() is not None
+        finally:
+            connection.close()
+    
+    def _load_migrated_ids(self, user_id: int) -> Set[int]:
+        """Get IDs of all recordings already migrated to S3
+        
+        Starts from the on-disk sync cache and only reads usage-log rows newer than
+        the last one the cache has seen, folding them back into the cache.
+        """
+        last_log_id = self.sync_cache.get_last_log_id(user_id)
+        
+        connection = self.get_db_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    SELECT resource_id, id
+                    FROM user_api_usage_log 
+                    WHERE user_id = %s 
+                    AND service_type = 's3_storage' 
+                    AND operation_type = 'upload' 
+                    AND success = 1
+                    AND resource_type = 'recording'
+                    AND id > %s
+                """, [user_id, last_log_id])
+                rows = cursor.fetchall()
         finally:
             connection.close()
+        
+        new_ids = {row[0] for row in rows if row[0] is not None}
+        if rows:
+            self.sync_cache.add(user_id, new_ids, max(row[1] for row in rows))
+        
+        return self.sync_cache.get_migrated_ids(user_id) | new_ids
     
-    def migrate_recording(self, user_id: int, recording: Dict) -> Dict:
-        """Migrate a single recording to S3"""
+    def migrate_recording(self, user_id: int, recording: Dict, already_migrated: Optional[bool] = None) -> Dict:
+        """Migrate a single recording to S3
+        
+        Batch callers pass already_migrated from _load_migrated_ids(); when it is
+        None the migration log is queried for this recording.
+        """
         try:
             recording_id = recording['id']
             local_path = recording['local_path']
             
             # Check if already migrated
-            if self.is_recording_migrated(user_id, recording_id):
+            if already_migrated is None:
+                already_migrated = self.is_recording_migrated(user_id, recording_id)
+            
+            if already_migrated:
                 return {
                     'success': True,
                     'skipped': True,
                     'message': f"Recording {recording['filename']} already migrated"
                 }
             
+            # File may have been removed (e.g. by housekeeping) since the directory scan
+            if not os.path.exists(local_path):
+                return {
+                    'success': True,
+                    'skipped': True,
+                    'message': f"Recording {recording['filename']} no longer exists locally"
+                }
+            
             # Generate organized remote key
-            date_str = recording['recorded_at'].strftime('%Y/%m/%d')
+            date_str = date_prefix(recording['recorded_at'].date())
             remote_key = f"recordings/{date_str}/{recording['filename']}"
             
             # Upload to S3
-            result = self.s3_service.upload_file(user_id, local_path, remote_key)
+            result = self.s3_service.upload_file(user_id, local_path, remote_key, file_size=recording['file_size'],
+                                                 recording_id=recording_id)
             
             if result['success']:
                 # Update recording with S3 URL if primary storage
@@ -164,8 +294,9 @@ class S3MigrationService:
         finally:
             connection.close()
     
-    def migrate_user_recordings(self, user_id: int, batch_size: int = 10, dry_run: bool = False) -> Dict:
-        """Migrate all recordings for a user to S3"""
+    def migrate_user_recordings(self, user_id: int, batch_size: int = 10, dry_run: bool = False,
+                                max_workers: int = 4) -> Dict:
+        """Migrate all recordings for a user to S3, uploading up to max_workers files concurrently"""
         try:
             # Get user's S3 configuration
             s3_configs = self.s3_service.get_user_s3_configs(user_id, active_only=True)
@@ -196,17 +327,28 @@ class S3MigrationService:
                     'total_size_mb': sum(r['file_size'] for r in recordings) / (1024 * 1024)
                 }
             
-            # Migrate recordings in batches
+            # Look up already-migrated recordings once instead of per recording
+            migrated_ids = self._load_migrated_ids(user_id)
+            
+            # Already-migrated recordings are counted as skipped without queueing any work
+            pending = [r for r in recordings if r['id'] not in migrated_ids]
+            
+            # Migrate recordings concurrently, logging progress every batch_size recordings
             migrated_count = 0
-            skipped_count = 0
+            skipped_count = len(recordings) - len(pending)
             failed_count = 0
             total_size = 0
+            uploaded_ids = []
             
-            for i in range(0, len(recordings), batch_size):
-                batch = recordings[i:i + batch_size]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.migrate_recording, user_id, recording, False): recording
+                    for recording in pending
+                }
                 
-                for recording in batch:
-                    result = self.migrate_recording(user_id, recording)
+                for completed, future in enumerate(as_completed(futures), 1):
+                    recording = futures[future]
+                    result = future.result()
                     
                     if result['success']:
                         if result.get('skipped', False):
@@ -214,11 +356,18 @@ class S3MigrationService:
                         else:
                             migrated_count += 1
                             total_size += recording['file_size']
+                            uploaded_ids.append(recording['id'])
                     else:
                         failed_count += 1
-                
-                # Log progress
-                logger.info(f"Batch {i//batch_size + 1} complete: {migrated_count} migrated, {skipped_count} skipped, {failed_count} failed")
+                    
+                    # Log progress
+                    if completed % batch_size == 0 or completed == len(pending):
+                        logger.info(f"Batch {(completed - 1)//batch_size + 1} complete: {migrated_count} migrated, {skipped_count} skipped, {failed_count} failed")
+            
+            # Cache the uploads only once their upload records are written; if the flush
+            # fails they are retried by the final flush and picked up from the log next run
+            if uploaded_ids and self.s3_service.flush_stats():
+                self.sync_cache.add(user_id, uploaded_ids)
             
             return {
                 'success': True,
@@ -234,6 +383,9 @@ class S3MigrationService:
             error_msg = f"Migration error: {str(e)}"
             logger.error(error_msg)
             return {'success': False, 'error': error_msg}
+        
+        finally:
+            self.s3_service.flush_stats()
     
     def get_migration_status(self, user_id: int) -> Dict:
         """Get migration status for a user"""
@@ -242,10 +394,8 @@ class S3MigrationService:
             total_recordings = len(recordings)
             total_size = sum(r['file_size'] for r in recordings)
             
-            migrated_count = 0
-            for recording in recordings:
-                if self.is_recording_migrated(user_id, recording['id']):
-                    migrated_count += 1
+            migrated_ids = self._load_migrated_ids(user_id)
+            migrated_count = len(migrated_ids & {r['id'] for r in recordings})
             
             return {
                 'success': True,
@@ -268,7 +418,8 @@ def main():
     parser = argparse.ArgumentParser(description='S3 Migration Service')
     parser.add_argument('--user-id', type=int, required=True, help='User ID for migration')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be migrated without doing it')
-    parser.add_argument('--batch-size', type=int, default=10, help='Number of recordings to migrate per batch')
+    parser.add_argument('--batch-size', type=int, default=10, help='Number of recordings per progress batch')
+    parser.add_argument('--max-workers', type=int, default=4, help='Number of concurrent uploads')
     parser.add_argument('--status', action='store_true', help='Check migration status')
     
     args = parser.parse_args()
@@ -279,7 +430,7 @@ def main():
         result = service.get_migration_status(args.user_id)
         print(f"Migration status: {json.dumps(result, indent=2)}")
     else:
-        result = service.migrate_user_recordings(args.user_id, args.batch_size, args.dry_run)
+        result = service.migrate_user_recordings(args.user_id, args.batch_size, args.dry_run, args.max_workers)
         print(f"Migration result: {json.dumps(result, indent=2)}")
 
 if __name__ == '__main__':
@@ -6,19 +6,32 @@ Issue #13 - Automatic cloud backup of recordings using user-configured S3 creden
 
 import os
 import sys
-import boto3
+import base64
+import functools
 import json
 import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from botocore.exceptions import ClientError, NoCredentialsError
+
+try:
+    import awscrt  # noqa: F401 - enables boto3's native CRT transfer client
+    HAS_CRT = True
+except ImportError:
+    HAS_CRT = False
+
+# The CRT transfer client is opt-in: it manages its own connections and retries, so the
+# botocore client tuning (max_pool_connections, adaptive retries, keepalive, accelerate
+# endpoint) does not apply to uploads that go through it
+USE_CRT = HAS_CRT and os.environ.get('S3_USE_CRT', '0') in ('1', 'true', 'yes')
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import database modules
-from backend.config.database import SessionLocal
-from backend.models.station import Recording, Show
+from backend.config.database import dict_cursor, get_pooled_connection
 
 # Configure logging
 logging.basicConfig(
@@ -27,75 +40,234 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# Size of each read s3transfer hands to the HTTP layer (default 256 KB); larger
+# reads mean fewer GIL hand-offs per part on fast links
+IO_CHUNK_SIZE = 1 * MB
+
+# Parts upload_fileobj() may hold in memory per file (s3transfer default 10). Peak
+# buffer memory is about workers x chunks x chunk size, e.g. 4 x 4 x 16 MB = 256 MB
+MAX_IN_MEMORY_CHUNKS = int(os.environ.get('S3_MAX_INMEMORY_CHUNKS', '4'))
+
+# How long cached S3 configs and clients are reused before being rebuilt
+CACHE_TTL_SECONDS = 300
+
+# S3 error codes that mean cached credentials/clients should be discarded
+CREDENTIAL_ERROR_CODES = {'InvalidAccessKeyId', 'SignatureDoesNotMatch', 'ExpiredToken', 'AccessDenied'}
+
+# Constant statements for the batched writes in flush_stats(). INSERT values are all
+# placeholders so the driver's executemany folds each batch into one multi-row INSERT
+UPLOAD_STATS_SQL = """
+    UPDATE user_s3_configs 
+    SET total_uploaded_bytes = total_uploaded_bytes + %s,
+        total_uploaded_files = total_uploaded_files + %s,
+        last_upload_at = NOW()
+    WHERE id = %s
+"""
+
+USAGE_LOG_SQL = """
+    INSERT INTO user_api_usage_log
+        (user_id, api_key_id, service_type, operation_type, resource_type, resource_id,
+         bytes_processed, response_time_ms, success)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+RECORDING_UPLOAD_SQL = """
+    INSERT INTO recording_s3_uploads (recording_id, config_id, remote_key)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE remote_key = VALUES(remote_key), uploaded_at = NOW()
+"""
+
+def _advise_sequential(fd, prefetch_bytes):
+    """Hint the kernel that a file is read front to back and start reading its first part"""
+    if hasattr(os, 'posix_fadvise'):
+        # Advice values are not flags, so they are given in separate calls
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, prefetch_bytes, os.POSIX_FADV_WILLNEED)
+
+@functools.lru_cache(maxsize=32)
+def _decode_credentials(encrypted_credentials):
+    """Get decrypted credentials - decode from base64 JSON (cached per credentials blob)"""
+    return json.loads(base64.b64decode(encrypted_credentials).decode('utf-8'))
+
+@functools.lru_cache(maxsize=1024)
+def date_prefix(recorded_date):
+    """Get the 'YYYY/MM/DD' remote key prefix for a recording date (cached per date)"""
+    return recorded_date.strftime('%Y/%m/%d')
+
 class S3UploadService:
+    """Uploads recordings and files to users' S3 configs
+    
+    upload_file() and upload_file_presigned() only queue their upload stats, usage-log
+    rows and recording upload records; call flush_stats() afterwards, or use the service
+    as a context manager, which flushes on exit. upload_recording() and
+    auto_upload_new_recordings() flush themselves.
+    """
+    
     def __init__(self):
-        pass
+        # Default multipart transfer tuning; configs can override per endpoint
+        # (S3-compatible backends such as B2 or MinIO may prefer other values)
+        self._default_chunk_mb = int(os.environ.get('S3_MULTIPART_CHUNK_MB', '16'))
+        self._default_max_concurrency = int(os.environ.get('S3_MAX_CONCURRENCY', '10'))
+        self._transfer_configs = {}  # (chunk_mb, max_concurrency) -> TransferConfig
+        
+        # Per-process caches so bulk uploads don't re-query configs or rebuild clients per file
+        self._configs_cache = {}  # user_id -> (cached_at, configs)
+        self._client_cache = {}   # (user_id, config_id) -> (cached_at, s3_client)
+        self._cache_lock = threading.Lock()
+        
+        # Upload bookkeeping accumulated until flush_stats(): per-config [bytes, files],
+        # usage-log rows, and recording -> config upload records
+        self._pending_stats = defaultdict(lambda: [0, 0])
+        self._pending_usage_log = []
+        self._pending_recording_uploads = []
+        self._stats_lock = threading.Lock()
+    
+    @functools.cached_property
+    def _http(self):
+        """HTTP session for presigned-URL uploads, pooled to match upload concurrency"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        http = requests.Session()
+        http.mount('https://', HTTPAdapter(pool_maxsize=10))
+        http.mount('http://', HTTPAdapter(pool_maxsize=10))
+        return http
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush_stats()
+        return False
         
     def get_user_s3_configs(self, user_id, active_only=True):
         """Get S3 configurations for a user"""
-        import mysql.connector
-        
+        connection = get_pooled_connection()
         try:
-            # Direct MySQL connection
-            db = mysql.connector.connect(
-                host='mysql',
-                port=3306,
-                user='radiograb',
-                password='radiograb_pass_2024',
-                database='radiograb'
-            )
-            cursor = db.cursor(dictionary=True)
-            
-            query = """
-                SELECT s3c.*, ak.encrypted_credentials
-                FROM user_s3_configs s3c
-                JOIN user_api_keys ak ON s3c.api_key_id = ak.id
-                WHERE s3c.user_id = %s
-            """
-            params = [user_id]
-            
-            if active_only:
-                query += " AND s3c.is_active = 1 AND ak.is_active = 1"
-            
-            query += " ORDER BY s3c.created_at"
-            
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            return results
-            
+            with dict_cursor(connection) as cursor:
+                query = """
+                    SELECT s3c.*, ak.encrypted_credentials
+                    FROM user_s3_configs s3c
+                    JOIN user_api_keys ak ON s3c.api_key_id = ak.id
+                    WHERE s3c.user_id = %s
+                """
+                params = [user_id]
+                
+                if active_only:
+                    query += " AND s3c.is_active = 1 AND ak.is_active = 1"
+                
+                query += " ORDER BY s3c.created_at"
+                
+                cursor.execute(query, params)
+                return cursor.fetchall()
         finally:
-            if 'cursor' in locals():
-                cursor.close()
-            if 'db' in locals():
-                db.close()
+            connection.close()
+    
+    def get_cached_s3_configs(self, user_id):
+        """Get active S3 configurations for a user, reusing results for CACHE_TTL_SECONDS"""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._configs_cache.get(user_id)
+            if cached and now - cached[0] < CACHE_TTL_SECONDS:
+                return cached[1]
+        
+        configs = self.get_user_s3_configs(user_id, active_only=True)
+        with self._cache_lock:
+            self._configs_cache[user_id] = (now, configs)
+        return configs
+    
+    def get_s3_client(self, user_id, config):
+        """Get S3 client for a user's config, reusing it for CACHE_TTL_SECONDS"""
+        key = (user_id, config['id'])
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._client_cache.get(key)
+            if cached and now - cached[0] < CACHE_TTL_SECONDS:
+                return cached[1]
+        
+        s3_client = self.create_s3_client(config['encrypted_credentials'], config)
+        if s3_client:
+            with self._cache_lock:
+                self._client_cache[key] = (now, s3_client)
+        return s3_client
+    
+    def get_transfer_config(self, config):
+        """Get the multipart TransferConfig for an S3 config, honoring per-config overrides"""
+        from boto3.s3.transfer import TransferConfig
+        
+        chunk_mb = config.get('multipart_chunk_mb') or self._default_chunk_mb
+        max_concurrency = config.get('max_concurrency') or self._default_max_concurrency
+        # The CRT client only talks to AWS S3; custom endpoints stay on the classic transfer manager
+        use_crt = USE_CRT and not config.get('endpoint_url')
+        key = (chunk_mb, max_concurrency, use_crt)
+        
+        with self._cache_lock:
+            transfer_config = self._transfer_configs.get(key)
+            if transfer_config is None:
+                if use_crt:
+                    transfer_config = TransferConfig(
+                        multipart_threshold=chunk_mb * MB,
+                        multipart_chunksize=chunk_mb * MB,
+                        max_concurrency=max_concurrency,
+                        preferred_transfer_client='crt'
+                    )
+                else:
+                    transfer_config = TransferConfig(
+                        multipart_threshold=chunk_mb * MB,
+                        multipart_chunksize=chunk_mb * MB,
+                        max_concurrency=max_concurrency,
+                        io_chunksize=IO_CHUNK_SIZE,
+                        use_threads=True
+                    )
+                    # Not a boto3 TransferConfig argument, but read by s3transfer
+                    transfer_config.max_in_memory_upload_chunks = MAX_IN_MEMORY_CHUNKS
+                self._transfer_configs[key] = transfer_config
+        return transfer_config
+    
+    def invalidate_cache(self, user_id):
+        """Drop cached S3 configs and clients for a user"""
+        with self._cache_lock:
+            self._configs_cache.pop(user_id, None)
+            for key in [k for k in self._client_cache if k[0] == user_id]:
+                del self._client_cache[key]
     
     def create_s3_client(self, credentials, config):
         """Create S3 client with user credentials"""
         try:
-            # Get decrypted credentials - decode from base64 JSON
-            import base64
+            # boto3 is imported on first use so runs with nothing to upload skip its import cost
+            import boto3
             from botocore.config import Config as BotocoreConfig
             
-            creds = json.loads(base64.b64decode(credentials).decode('utf-8'))
+            creds = _decode_credentials(credentials)
             
             # Configure for Backblaze B2 compatibility (boto3 >= 1.35.99 fix)
-            client_config = BotocoreConfig(
-                signature_version='s3v4',
-                s3={
-                    'addressing_style': 'path'
-                }
-            )
+            s3_options = {
+                'addressing_style': 'path'
+            }
             
             # Add checksum fix for boto3 >= 1.35.99 with Backblaze B2
             if config.get('endpoint_url') and 'backblazeb2.com' in config['endpoint_url']:
-                client_config = BotocoreConfig(
-                    signature_version='s3v4',
-                    s3={
-                        'addressing_style': 'path',
-                        'payload_signing_enabled': False
-                    }
-                )
+                s3_options['payload_signing_enabled'] = False
+            
+            # Transfer Acceleration only exists on AWS endpoints and needs virtual-hosted addressing
+            if config.get('transfer_acceleration') and not config.get('endpoint_url'):
+                s3_options['use_accelerate_endpoint'] = True
+                s3_options['addressing_style'] = 'virtual'
+            
+            # Adaptive retries back off under throttling from parallel uploads. The client is
+            # cached and shared by all upload workers, so its connection pool must cover every
+            # worker's multipart threads or part uploads queue for a connection
+            upload_workers = int(os.environ.get('S3_AUTO_WORKERS', '4'))
+            max_concurrency = self.get_transfer_config(config).max_concurrency
+            client_config = BotocoreConfig(
+                signature_version='s3v4',
+                s3=s3_options,
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                max_pool_connections=max(50, upload_workers * max_concurrency),
+                tcp_keepalive=True
+            )
             
             session = boto3.Session(
                 aws_access_key_id=creds['access_key_id'],
@@ -115,33 +287,148 @@ class S3UploadService:
             logger.error(f"Failed to create S3 client: {str(e)}")
             return None
     
-    def upload_file(self, user_id, local_file_path, remote_key=None, config_name=None):
-        """Upload a file to user's S3 storage"""
+    def _select_config(self, user_id, config_name=None):
+        """Pick the named S3 config (or the first active one); returns (config, error)"""
+        s3_configs = self.get_cached_s3_configs(user_id)
+        
+        if not s3_configs:
+            return None, 'No active S3 configuration found'
+        
+        # Use specific config if requested, otherwise use first active config
+        if not config_name:
+            return s3_configs[0], None
+        
+        for cfg in s3_configs:
+            if cfg['config_name'] == config_name:
+                return cfg, None
+        
+        return None, f'S3 configuration "{config_name}" not found'
+    
+    def get_presigned_upload_url(self, user_id, remote_key, config_name=None, expires_in=3600):
+        """Get a presigned PUT URL so a client can upload directly to S3 without proxying through this service"""
+        try:
+            config, error = self._select_config(user_id, config_name)
+            if error:
+                return {'success': False, 'error': error}
+            
+            s3_client = self.get_s3_client(user_id, config)
+            if not s3_client:
+                return {'success': False, 'error': 'Failed to create S3 client'}
+            
+            url = s3_client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': config['bucket_name'],
+                    'Key': remote_key,
+                    'StorageClass': config['storage_class']
+                },
+                ExpiresIn=expires_in
+            )
+            
+            return {
+                'success': True,
+                'url': url,
+                'headers': {'x-amz-storage-class': config['storage_class']},
+                'config_id': config['id'],
+                'api_key_id': config['api_key_id'],
+                'expires_in': expires_in
+            }
+            
+        except Exception as e:
+            error_msg = f"Presign error: {str(e)}"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+    
+    def upload_file_presigned(self, user_id, local_file_path, remote_key=None, config_name=None):
+        """Upload a file with a single presigned PUT, bypassing boto3's transfer manager
+        
+        The upload is recorded by the next flush_stats() call.
+        """
+        import requests
+        
         try:
-            if not os.path.exists(local_file_path):
+            try:
+                file_size = os.stat(local_file_path).st_size
+            except FileNotFoundError:
                 return {'success': False, 'error': 'Local file does not exist'}
             
-            # Get S3 configurations for user
-            s3_configs = self.get_user_s3_configs(user_id, active_only=True)
+            if not remote_key:
+                config, error = self._select_config(user_id, config_name)
+                if error:
+                    return {'success': False, 'error': error}
+                remote_key = f"{config['path_prefix']}{os.path.basename(local_file_path)}"
             
-            if not s3_configs:
-                return {'success': False, 'error': 'No active S3 configuration found'}
+            presigned = self.get_presigned_upload_url(user_id, remote_key, config_name)
+            if not presigned['success']:
+                return presigned
             
-            # Use specific config if requested, otherwise use first active config
-            config = None
-            if config_name:
-                for cfg in s3_configs:
-                    if cfg['config_name'] == config_name:
-                        config = cfg
-                        break
-            else:
-                config = s3_configs[0]
-                
-            if not config:
-                return {'success': False, 'error': f'S3 configuration "{config_name}" not found'}
+            start_ns = time.monotonic_ns()
+            
+            with open(local_file_path, 'rb') as fh:
+                _advise_sequential(fh.fileno(), self._default_chunk_mb * MB)
+                response = self._http.put(presigned['url'], data=fh, headers=presigned['headers'])
+            response.raise_for_status()
             
-            # Create S3 client
-            s3_client = self.create_s3_client(config['encrypted_credentials'], config)
+            elapsed_ns = time.monotonic_ns() - start_ns
+            upload_time = elapsed_ns / 1e9
+            
+            self._record_upload(user_id, presigned['config_id'], presigned['api_key_id'],
+                                file_size, elapsed_ns, remote_key)
+            
+            logger.info(f"Successfully uploaded {local_file_path} to S3 as {remote_key} (presigned)")
+            
+            return {
+                'success': True,
+                'message': 'File uploaded successfully',
+                'remote_key': remote_key,
+                'file_size': file_size,
+                'upload_time': upload_time
+            }
+            
+        except requests.RequestException as e:
+            error_msg = f"Presigned upload failed: {str(e)}"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+            
+        except Exception as e:
+            error_msg = f"Upload error: {str(e)}"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+    
+    def upload_file(self, user_id, local_file_path, remote_key=None, config_name=None, file_size=None,
+                    recording_id=None):
+        """Upload a file to user's S3 storage
+        
+        Callers that already stat'ed the file (e.g. the migration scan) pass file_size
+        to skip the stat call. When recording_id is given the upload is recorded in
+        recording_s3_uploads. The upload is recorded by the next flush_stats() call.
+        """
+        try:
+            if file_size is None:
+                try:
+                    file_size = os.stat(local_file_path).st_size
+                except FileNotFoundError:
+                    return {'success': False, 'error': 'Local file does not exist'}
+            
+            config, error = self._select_config(user_id, config_name)
+            if error:
+                return {'success': False, 'error': error}
+            
+            return self._upload_to_config(user_id, config, local_file_path, remote_key, file_size,
+                                          recording_id)
+            
+        except Exception as e:
+            error_msg = f"Upload error: {str(e)}"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+    
+    def _upload_to_config(self, user_id, config, local_file_path, remote_key, file_size, recording_id=None):
+        """Upload a file of known size using an already-selected S3 config"""
+        from botocore.exceptions import ClientError
+        
+        try:
+            # Get (cached) S3 client
+            s3_client = self.get_s3_client(user_id, config)
             if not s3_client:
                 return {'success': False, 'error': 'Failed to create S3 client'}
             
@@ -151,44 +438,28 @@ class S3UploadService:
                 remote_key = f"{config['path_prefix']}{filename}"
             
             # Upload file
-            start_time = datetime.now()
-            file_size = os.path.getsize(local_file_path)
-            
-            s3_client.upload_file(
-                local_file_path,
-                config['bucket_name'],
-                remote_key,
-                ExtraArgs={
-                    'StorageClass': config['storage_class']
-                }
-            )
+            start_ns = time.monotonic_ns()
             
-            upload_time = (datetime.now() - start_time).total_seconds()
-            
-            # Update S3 config stats
-            import mysql.connector
-            try:
-                db = mysql.connector.connect(
-                    host='mysql',
-                    port=3306,
-                    user='radiograb',
-                    password='radiograb_pass_2024',
-                    database='radiograb'
+            # Read in multipart-chunk-sized blocks so each part is one read from (network) storage
+            transfer_config = self.get_transfer_config(config)
+            with open(local_file_path, 'rb', buffering=transfer_config.multipart_chunksize) as fh:
+                _advise_sequential(fh.fileno(), transfer_config.multipart_chunksize)
+                
+                s3_client.upload_fileobj(
+                    fh,
+                    config['bucket_name'],
+                    remote_key,
+                    ExtraArgs={
+                        'StorageClass': config['storage_class']
+                    },
+                    Config=transfer_config
                 )
-                cursor = db.cursor()
-                cursor.execute("""
-                    UPDATE user_s3_configs 
-                    SET total_uploaded_bytes = total_uploaded_bytes + %s,
-                        total_uploaded_files = total_uploaded_files + 1,
-                        last_upload_at = NOW()
-                    WHERE id = %s
-                """, [file_size, config['id']])
-                db.commit()
-            finally:
-                if 'cursor' in locals():
-                    cursor.close()
-                if 'db' in locals():
-                    db.close()
+            
+            elapsed_ns = time.monotonic_ns() - start_ns
+            upload_time = elapsed_ns / 1e9
+            
+            self._record_upload(user_id, config['id'], config['api_key_id'],
+                                file_size, elapsed_ns, remote_key, recording_id)
             
             logger.info(f"Successfully uploaded {local_file_path} to S3 as {remote_key}")
             
@@ -204,6 +475,10 @@ class S3UploadService:
             error_msg = f"S3 upload failed: {str(e)}"
             logger.error(error_msg)
             
+            # Credentials may have been rotated or revoked; rebuild on next upload
+            if e.response.get('Error', {}).get('Code') in CREDENTIAL_ERROR_CODES:
+                self.invalidate_cache(user_id)
+            
             # Log failed upload (simplified for now)
             
             return {'success': False, 'error': error_msg}
@@ -213,43 +488,139 @@ class S3UploadService:
             logger.error(error_msg)
             return {'success': False, 'error': error_msg}
     
+    def _record_upload(self, user_id, config_id, api_key_id, file_size, elapsed_ns, remote_key,
+                       recording_id=None):
+        """Queue stats, usage log and recording upload rows for a successful upload; written by flush_stats()"""
+        with self._stats_lock:
+            stats = self._pending_stats[config_id]
+            stats[0] += file_size
+            stats[1] += 1
+            
+            self._pending_usage_log.append((
+                user_id, api_key_id, 's3_storage', 'upload',
+                'recording' if recording_id else None, recording_id,
+                file_size, elapsed_ns // 1_000_000, 1
+            ))
+            
+            if recording_id:
+                self._pending_recording_uploads.append((recording_id, config_id, remote_key))
+    
+    def flush_stats(self):
+        """Write accumulated upload stats, usage log rows and upload records in one transaction
+        
+        Returns False if the write failed; the batch is then kept for the next flush.
+        """
+        with self._stats_lock:
+            pending = dict(self._pending_stats)
+            usage_log = self._pending_usage_log
+            recording_uploads = self._pending_recording_uploads
+            self._pending_stats.clear()
+            self._pending_usage_log = []
+            self._pending_recording_uploads = []
+        
+        if not pending:
+            return True
+        
+        connection = None
+        try:
+            connection = get_pooled_connection()
+            with connection.cursor() as cursor:
+                cursor.executemany(UPLOAD_STATS_SQL, [
+                    (total_bytes, total_files, config_id)
+                    for config_id, (total_bytes, total_files) in pending.items()
+                ])
+                cursor.executemany(USAGE_LOG_SQL, usage_log)
+                if recording_uploads:
+                    cursor.executemany(RECORDING_UPLOAD_SQL, recording_uploads)
+            connection.commit()
+            return True
+        except Exception as e:
+            # Keep the batch for the next flush - the upload records decide what
+            # auto_upload_new_recordings uploads again
+            logger.error(f"Failed to update S3 upload stats, will retry on next flush: {str(e)}")
+            if connection is not None:
+                try:
+                    connection.rollback()
+                except Exception:
+                    pass
+            self._requeue_pending(pending, usage_log, recording_uploads)
+            return False
+        finally:
+            if connection is not None:
+                connection.close()
+    
+    def _requeue_pending(self, pending, usage_log, recording_uploads):
+        """Put an unwritten batch back in front of anything queued since it was taken"""
+        with self._stats_lock:
+            for config_id, (total_bytes, total_files) in pending.items():
+                stats = self._pending_stats[config_id]
+                stats[0] += total_bytes
+                stats[1] += total_files
+            self._pending_usage_log = usage_log + self._pending_usage_log
+            self._pending_recording_uploads = recording_uploads + self._pending_recording_uploads
+    
     def upload_recording(self, user_id, recording_id):
-        """Upload a specific recording to S3"""
+        """Upload a specific recording to S3 and record the upload"""
         try:
             # Get recording information
-            recording = self.db.fetchOne("""
-                SELECT r.*, s.name as show_name, st.call_letters
-                FROM recordings r
-                JOIN shows s ON r.show_id = s.id
-                JOIN stations st ON s.station_id = st.id
-                WHERE r.id = ? AND s.user_id = ?
-            """, [recording_id, user_id])
+            connection = get_pooled_connection()
+            try:
+                with dict_cursor(connection) as cursor:
+                    cursor.execute("""
+                        SELECT r.*, s.name as show_name, st.call_letters
+                        FROM recordings r
+                        JOIN shows s ON r.show_id = s.id
+                        JOIN stations st ON s.station_id = st.id
+                        WHERE r.id = %s AND s.user_id = %s
+                    """, [recording_id, user_id])
+                    recording = cursor.fetchone()
+            finally:
+                connection.close()
             
             if not recording:
                 return {'success': False, 'error': 'Recording not found'}
             
             # Check if user has auto-upload enabled
-            s3_configs = self.get_user_s3_configs(user_id, active_only=True)
-            upload_configs = [c for c in s3_configs if c['auto_upload_recordings']]
+            upload_configs = self.get_auto_upload_configs(user_id)
             
             if not upload_configs:
                 return {'success': False, 'error': 'Auto-upload not enabled'}
             
+            return self._upload_recording_to_configs(user_id, recording, upload_configs)
+            
+        except Exception as e:
+            error_msg = f"Recording upload error: {str(e)}"
+            logger.error(error_msg)
+            return {'success': False, 'error': error_msg}
+        
+        finally:
+            self.flush_stats()
+    
+    def get_auto_upload_configs(self, user_id):
+        """Get the user's active S3 configs with auto-upload enabled"""
+        return [c for c in self.get_cached_s3_configs(user_id) if c['auto_upload_recordings']]
+    
+    def _upload_recording_to_configs(self, user_id, recording, upload_configs):
+        """Upload a recording row (id, filename, recorded_at) to each of the given S3 configs"""
+        try:
             # Construct file path
             recordings_dir = os.environ.get('RECORDINGS_DIR', '/var/radiograb/recordings')
             file_path = os.path.join(recordings_dir, recording['filename'])
             
-            if not os.path.exists(file_path):
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 return {'success': False, 'error': f'Recording file not found: {recording["filename"]}'}
             
             # Generate organized remote key
-            date_str = recording['recorded_at'].strftime('%Y/%m/%d')
+            date_str = date_prefix(recording['recorded_at'].date())
             remote_key = f"recordings/{date_str}/{recording['filename']}"
             
             # Upload to each configured S3 service
             results = []
             for config in upload_configs:
-                result = self.upload_file(user_id, file_path, remote_key, config['config_name'])
+                result = self._upload_to_config(user_id, config, file_path, remote_key, file_size,
+                                                recording['id'])
                 results.append({
                     'config_name': config['config_name'],
                     'result': result
@@ -267,52 +638,81 @@ class S3UploadService:
             return {'success': False, 'error': error_msg}
     
     def auto_upload_new_recordings(self, user_id=None):
-        """Upload any new recordings that haven't been uploaded yet"""
+        """Upload any new recordings that haven't been uploaded yet
+        
+        Uploads run on a shared thread pool (S3_AUTO_WORKERS, default 4); each user's
+        recordings are submitted as soon as they are found, so lookups for the next
+        user overlap with uploads already in flight.
+        """
         try:
             # Get users with auto-upload enabled
+            users_query = """
+                SELECT DISTINCT s3c.user_id
+                FROM user_s3_configs s3c
+                WHERE s3c.auto_upload_recordings = 1 AND s3c.is_active = 1
+            """
+            params = []
             if user_id:
-                users_query = """
-                    SELECT DISTINCT s3c.user_id
-                    FROM user_s3_configs s3c
-                    WHERE s3c.user_id = ? AND s3c.auto_upload_recordings = 1 AND s3c.is_active = 1
-                """
-                users = self.db.fetchAll(users_query, [user_id])
-            else:
-                users_query = """
-                    SELECT DISTINCT s3c.user_id
-                    FROM user_s3_configs s3c
-                    WHERE s3c.auto_upload_recordings = 1 AND s3c.is_active = 1
-                """
-                users = self.db.fetchAll(users_query)
+                users_query += " AND s3c.user_id = %s"
+                params.append(user_id)
+            
+            connection = get_pooled_connection()
+            try:
+                with dict_cursor(connection) as cursor:
+                    cursor.execute(users_query, params)
+                    users = cursor.fetchall()
+            finally:
+                connection.close()
             
             total_uploaded = 0
+            max_workers = int(os.environ.get('S3_AUTO_WORKERS', '4'))
             
-            for user in users:
-                user_id = user['user_id']
-                
-                # Get recordings that haven't been uploaded
-                unuploaded_recordings = self.db.fetchAll("""
-                    SELECT r.id, r.filename, r.recorded_at
-                    FROM recordings r
-                    JOIN shows s ON r.show_id = s.id
-                    WHERE s.user_id = ? 
-                    AND r.id NOT IN (
-                        SELECT DISTINCT CAST(SUBSTRING_INDEX(resource_id, '_', -1) AS UNSIGNED)
-                        FROM user_api_usage_log 
-                        WHERE user_id = ? 
-                        AND service_type = 's3_storage' 
-                        AND operation_type = 'upload' 
-                        AND success = 1
-                        AND resource_type = 'recording'
-                    )
-                    ORDER BY r.recorded_at ASC
-                    LIMIT 50
-                """, [user_id, user_id])
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
                 
-                logger.info(f"Found {len(unuploaded_recordings)} unuploaded recordings for user {user_id}")
+                for user in users:
+                    user_id = user['user_id']
+                    
+                    # Resolve the user's upload targets once for all of their recordings
+                    upload_configs = self.get_auto_upload_configs(user_id)
+                    if not upload_configs:
+                        continue
+                    
+                    # Get recordings that haven't been uploaded, per config, so a recording
+                    # already in one bucket is still sent to the others (and only to those)
+                    missing_configs = {}  # recording id -> (recording, configs lacking it)
+                    connection = get_pooled_connection()
+                    try:
+                        with dict_cursor(connection) as cursor:
+                            for config in upload_configs:
+                                cursor.execute("""
+                                    SELECT r.id, r.filename, r.recorded_at
+                                    FROM recordings r
+                                    JOIN shows s ON r.show_id = s.id
+                                    LEFT JOIN recording_s3_uploads u
+                                        ON u.recording_id = r.id AND u.config_id = %s
+                                    WHERE s.user_id = %s 
+                                    AND u.recording_id IS NULL
+                                    ORDER BY r.recorded_at ASC
+                                    LIMIT 50
+                                """, [config['id'], user_id])
+                                for recording in cursor.fetchall():
+                                    entry = missing_configs.setdefault(recording['id'], (recording, []))
+                                    entry[1].append(config)
+                    finally:
+                        connection.close()
+                    
+                    logger.info(f"Found {len(missing_configs)} unuploaded recordings for user {user_id}")
+                    
+                    for recording, configs in sorted(missing_configs.values(),
+                                                     key=lambda entry: entry[0]['recorded_at']):
+                        future = executor.submit(self._upload_recording_to_configs, user_id, recording,
+                                                 configs)
+                        futures[future] = recording
                 
-                for recording in unuploaded_recordings:
-                    result = self.upload_recording(user_id, recording['id'])
+                for future in as_completed(futures):
+                    recording = futures[future]
+                    result = future.result()
                     if result['success']:
                         total_uploaded += 1
                         logger.info(f"Auto-uploaded recording {recording['filename']}")
@@ -329,6 +729,9 @@ class S3UploadService:
             error_msg = f"Auto-upload error: {str(e)}"
             logger.error(error_msg)
             return {'success': False, 'error': error_msg}
+        
+        finally:
+            self.flush_stats()
 
 def main():
     """Command line interface for S3 upload service"""
@@ -340,25 +743,29 @@ def main():
     parser.add_argument('--auto-upload', action='store_true', help='Auto-upload new recordings')
     parser.add_argument('--file-path', help='Local file path to upload')
     parser.add_argument('--remote-key', help='Remote S3 key (optional)')
+    parser.add_argument('--presigned', action='store_true', help='Upload --file-path through a presigned PUT URL')
     
     args = parser.parse_args()
     
-    service = S3UploadService()
-    
-    if args.recording_id and args.user_id:
-        result = service.upload_recording(args.user_id, args.recording_id)
-        print(f"Upload result: {result}")
-        
-    elif args.auto_upload:
-        result = service.auto_upload_new_recordings(args.user_id)
-        print(f"Auto-upload result: {result}")
-        
-    elif args.file_path and args.user_id:
-        result = service.upload_file(args.user_id, args.file_path, args.remote_key)
-        print(f"File upload result: {result}")
-        
-    else:
-        parser.print_help()
+    with S3UploadService() as service:
+        if args.recording_id and args.user_id:
+            result = service.upload_recording(args.user_id, args.recording_id)
+            print(f"Upload result: {result}")
+            
+        elif args.auto_upload:
+            result = service.auto_upload_new_recordings(args.user_id)
+            print(f"Auto-upload result: {result}")
+            
+        elif args.file_path and args.user_id and args.presigned:
+            result = service.upload_file_presigned(args.user_id, args.file_path, args.remote_key)
+            print(f"File upload result: {result}")
+            
+        elif args.file_path and args.user_id:
+            result = service.upload_file(args.user_id, args.file_path, args.remote_key)
+            print(f"File upload result: {result}")
+            
+        else:
+            parser.print_help()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -26,6 +26,7 @@ import logging
 import json
 from datetime import datetime, time
 from typing import List, Dict, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from backend.config.database import SessionLocal
@@ -35,6 +36,24 @@ from backend.services.schedule_parser import ScheduleParser
 
 logger = logging.getLogger(__name__)
 
+# Day bits indexed by cron day-of-week number (0=Sunday, 1=Monday, etc.)
+_DAY_BIT = {
+    'sunday': 1 << 0, 'monday': 1 << 1, 'tuesday': 1 << 2, 'wednesday': 1 << 3,
+    'thursday': 1 << 4, 'friday': 1 << 5, 'saturday': 1 << 6
+}
+# Cron day-of-week field for every non-empty day mask, e.g. 0b0101010 -> '1,3,5'
+_MASK_TO_CRON = {
+    mask: ','.join(str(day) for day in range(7) if mask & (1 << day))
+    for mask in range(1, 128)
+}
+# Display order for day lists in schedule descriptions
+_DAY_ORDER = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+_WEEKDAYS = frozenset(['monday', 'tuesday', 'wednesday', 'thursday', 'friday'])
+_WEEKENDS = frozenset(['saturday', 'sunday'])
+
 
 class ScheduleImporter:
     """Imports parsed schedule data into the database"""
@@ -78,9 +97,10 @@ class ScheduleImporter:
             
             # Filter shows if selective import is requested
             if selected_shows:
-                selected_names = {show['name'] for show in selected_shows}
+                # Match names case- and whitespace-insensitively so parser casing differences don't drop shows
+                selected_names = {show['name'].strip().casefold() for show in selected_shows}
                 original_count = len(shows)
-                shows = [show for show in shows if show.name in selected_names]
+                shows = [show for show in shows if show.name.strip().casefold() in selected_names]
                 logger.info(f"Filtered {original_count} shows to {len(shows)} selected shows")
                 results['shows_found'] = len(shows)
                 
@@ -88,11 +108,20 @@ class ScheduleImporter:
                     logger.warning("No selected shows found in parsed schedule")
                     return results
             
+            # Load the station's existing shows once, keyed by lowercased name
+            existing_shows = {
+                show.name.lower(): show
+                for show in db.query(Show).filter(Show.station_id == station_id).all()
+            }
+            
+            # New shows are collected here and inserted in bulk after the loop
+            new_shows = []
+            
             # Process each show
             for show_schedule in shows:
                 try:
                     result = self._process_show_schedule(
-                        db, station_id, show_schedule, 
+                        db, station_id, show_schedule, existing_shows, new_shows,
                         auto_create_shows, update_existing
                     )
                     
@@ -107,10 +136,14 @@ class ScheduleImporter:
                     logger.error(f"Error processing show {show_schedule.name}: {e}")
                     results['errors'] += 1
             
+            # Insert all new shows and apply updates in a single transaction
+            station_name = station.name
+            if new_shows:
+                db.bulk_save_objects(new_shows)
             db.commit()
             db.close()
             
-            logger.info(f"Schedule import completed for {station.name}: "
+            logger.info(f"Schedule import completed for {station_name}: "
                        f"{results['shows_created']} created, "
                        f"{results['shows_updated']} updated, "
                        f"{results['shows_skipped']} skipped")
@@ -123,14 +156,17 @@ class ScheduleImporter:
     
     def _process_show_schedule(self, db: Session, station_id: int, 
                              show_schedule: ShowSchedule,
+                             existing_shows: Dict[str, Show], new_shows: List[Show],
                              auto_create: bool, update_existing: bool) -> str:
-        """Process a single show schedule entry"""
+        """Process a single show schedule entry
+        
+        existing_shows maps lowercased show name -> Show for the station; newly
+        created shows are added to it so repeated names in one import aren't duplicated.
+        New shows are appended to new_shows for the caller to save in bulk.
+        """
         
         # Check if show already exists (exact name match, case-insensitive)
-        existing_show = db.query(Show).filter(
-            Show.station_id == station_id,
-            Show.name.ilike(show_schedule.name)
-        ).first()
+        existing_show = existing_shows.get(show_schedule.name.lower())
         
         if existing_show:
             if update_existing:
@@ -145,11 +181,13 @@ class ScheduleImporter:
             return 'skipped'
         
         # Create new show
-        return self._create_new_show(db, station_id, show_schedule)
+        show = self._create_new_show(station_id, show_schedule)
+        existing_shows[show_schedule.name.lower()] = show
+        new_shows.append(show)
+        return 'created'
     
-    def _create_new_show(self, db: Session, station_id: int, 
-                        show_schedule: ShowSchedule) -> str:
-        """Create a new show from schedule data"""
+    def _create_new_show(self, station_id: int, show_schedule: ShowSchedule) -> Show:
+        """Build a new (unsaved) show from schedule data"""
         
         try:
             # Convert show schedule to cron expression
@@ -169,12 +207,8 @@ class ScheduleImporter:
                 host=show_schedule.host
             )
             
-            db.add(show)
-            db.flush()  # Get the ID
-            db.commit()  # Ensure it's saved
-            
-            logger.info(f"Created show: {show.name} (ID: {show.id}, active: {show.active}, schedule: {schedule_desc})")
-            return 'created'
+            logger.info(f"Created show: {show.name} (active: {show.active}, schedule: {schedule_desc})")
+            return show
             
         except Exception as e:
             logger.error(f"Error creating show {show_schedule.name}: {e}")
@@ -221,25 +255,17 @@ class ScheduleImporter:
     def _generate_cron_expression(self, show_schedule: ShowSchedule) -> str:
         """Generate cron expression from show schedule"""
         
-        # Convert days to cron day numbers (0=Sunday, 1=Monday, etc.)
-        day_map = {
-            'sunday': '0', 'monday': '1', 'tuesday': '2', 'wednesday': '3',
-            'thursday': '4', 'friday': '5', 'saturday': '6'
-        }
-        
-        cron_days = []
+        # Convert days to a bitmask of cron day numbers
+        mask = 0
         for day in show_schedule.days:
-            if day in day_map:
-                cron_days.append(day_map[day])
+            mask |= _DAY_BIT.get(day, 0)
         
-        if not cron_days:
-            # Default to weekdays if no days specified
-            cron_days = ['1', '2', '3', '4', '5']
+        # Default to weekdays if no days specified
+        days_str = _MASK_TO_CRON.get(mask, '1,2,3,4,5')
         
         # Create cron expression: minute hour * * day_of_week
         minute = show_schedule.start_time.minute
         hour = show_schedule.start_time.hour
-        days_str = ','.join(sorted(cron_days))
         
         return f"{minute} {hour} * * {days_str}"
     
@@ -247,19 +273,18 @@ class ScheduleImporter:
         """Generate human-readable schedule description"""
         
         # Format days
-        if len(show_schedule.days) == 7:
+        days_set = frozenset(show_schedule.days)
+        if len(days_set) == 7:
             days_str = "every day"
-        elif len(show_schedule.days) == 5 and all(d in show_schedule.days for d in 
-                ['monday', 'tuesday', 'wednesday', 'thursday', 'friday']):
+        elif days_set == _WEEKDAYS:
             days_str = "weekdays"
-        elif len(show_schedule.days) == 2 and all(d in show_schedule.days for d in 
-                ['saturday', 'sunday']):
+        elif days_set == _WEEKENDS:
             days_str = "weekends"
-        elif len(show_schedule.days) == 1:
+        elif len(days_set) == 1:
             days_str = f"every {show_schedule.days[0].title()}"
         else:
             # Format as "Mondays, Wednesdays, and Fridays"
-            day_names = [day.title() for day in show_schedule.days]
+            day_names = [day.title() for day in sorted(days_set, key=lambda d: _DAY_ORDER.get(d, 7))]
             if len(day_names) == 2:
                 days_str = f"{day_names[0]} and {day_names[1]}"
             else:
@@ -289,13 +314,21 @@ class ScheduleImporter:
             # Parse schedule from station website
             shows = self.calendar_parser.parse_station_schedule(station.website_url, station_id)
             
+            # Look up all existing shows in one query (exact name match, case-insensitive)
+            names = {show_schedule.name.lower() for show_schedule in shows}
+            existing_map = {}
+            if names:
+                existing_map = {
+                    show.name.lower(): show
+                    for show in db.query(Show.id, Show.name).filter(
+                        Show.station_id == station_id,
+                        func.lower(Show.name).in_(names)
+                    )
+                }
+            
             preview_data = []
             for show_schedule in shows:
-                # Check if show already exists
-                existing_show = db.query(Show).filter(
-                    Show.station_id == station_id,
-                    Show.name.ilike(f"%{show_schedule.name}%")
-                ).first()
+                existing_show = existing_map.get(show_schedule.name.lower())
                 
                 cron_expression = self._generate_cron_expression(show_schedule)
                 schedule_desc = self._generate_schedule_description(show_schedule)
@@ -19,11 +19,15 @@ Inter-script Communication:
 import sys
 import os
 import logging
+from contextlib import contextmanager
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 # Add project root to path
 sys.path.insert(0, '/opt/radiograb')
 
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 from backend.config.database import SessionLocal
 from backend.models.station import Show
 from backend.services.recording_service import RecordingScheduler, EnhancedRecordingService
@@ -40,53 +44,88 @@ class ScheduleManager:
     Manages integration between web interface and recording scheduler
     """
     
-    def __init__(self):
-        self.recording_service = EnhancedRecordingService()
-        self.scheduler = RecordingScheduler(self.recording_service)
+    # The recording service and scheduler are created on first use, so read-only
+    # operations such as --status don't start APScheduler
+    @cached_property
+    def recording_service(self) -> EnhancedRecordingService:
+        return EnhancedRecordingService()
+    
+    @cached_property
+    def scheduler(self) -> RecordingScheduler:
+        return RecordingScheduler(self.recording_service)
+    
+    def _scheduler_started(self) -> bool:
+        """Whether the scheduler has been created in this process"""
+        return 'scheduler' in self.__dict__
+    
+    @contextmanager
+    def _session(self, session: Optional[Session] = None):
+        """Yield the caller's session, or a new one that is closed afterwards"""
+        if session is not None:
+            yield session
+            return
+        
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
         
-    def add_show_schedule(self, show_id: int) -> Dict[str, Any]:
+    def add_show_schedule(self, show_id: int, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Add a show to the scheduler after it's created in the web interface
         
         Args:
             show_id: Database ID of the show to schedule
+            session: Optional open session to reuse instead of opening a new one
             
         Returns:
             Dictionary with scheduling results
         """
         logger.info(f"Adding schedule for show {show_id}")
         
-        db = SessionLocal()
-        try:
+        with self._session(session) as db:
             show = db.query(Show).filter(Show.id == show_id).first()
             if not show:
                 return {'success': False, 'error': f'Show {show_id} not found'}
-                
-            if not show.active:
-                return {'success': False, 'error': f'Show {show_id} is not active'}
-                
-            if not show.schedule_pattern:
-                return {'success': False, 'error': f'Show {show_id} has no schedule pattern'}
-            
-            # Schedule the show
-            result = self.scheduler.schedule_show(show_id)
-            
-            if result['success']:
-                logger.info(f"Successfully scheduled show {show_id}: {show.name}")
-            else:
-                logger.error(f"Failed to schedule show {show_id}: {result['error']}")
-                
-            return result
             
-        finally:
-            db.close()
+            return self.add_show_schedule_from_obj(show)
+    
+    def add_show_schedule_from_obj(self, show: Show) -> Dict[str, Any]:
+        """
+        Add an already-loaded show to the scheduler, skipping the database lookup
+        
+        Args:
+            show: Show instance whose session is still open
+            
+        Returns:
+            Dictionary with scheduling results
+        """
+        show_id = show.id
+        
+        if not show.active:
+            return {'success': False, 'error': f'Show {show_id} is not active'}
+            
+        if not show.schedule_pattern:
+            return {'success': False, 'error': f'Show {show_id} has no schedule pattern'}
+        
+        # Schedule the show
+        result = self.scheduler.schedule_loaded_show(show)
+        
+        if result['success']:
+            logger.info(f"Successfully scheduled show {show_id}: {show.name}")
+        else:
+            logger.error(f"Failed to schedule show {show_id}: {result['error']}")
+            
+        return result
     
-    def update_show_schedule(self, show_id: int) -> Dict[str, Any]:
+    def update_show_schedule(self, show_id: int, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Update a show's schedule (remove old, add new)
         
         Args:
             show_id: Database ID of the show to reschedule
+            session: Optional open session to reuse instead of opening a new one
             
         Returns:
             Dictionary with scheduling results
@@ -97,7 +136,7 @@ class ScheduleManager:
         self.scheduler.unschedule_show(show_id)
         
         # Add new schedule
-        return self.add_show_schedule(show_id)
+        return self.add_show_schedule(show_id, session=session)
     
     def remove_show_schedule(self, show_id: int) -> Dict[str, Any]:
         """
@@ -127,10 +166,8 @@ class ScheduleManager:
         """
         logger.info("Refreshing all show schedules")
         
-        # Get current jobs and remove them
-        current_jobs = self.scheduler.get_scheduled_jobs()
-        for job in current_jobs:
-            self.scheduler.unschedule_show(job['show_id'])
+        # Remove all current jobs at once
+        self.scheduler.unschedule_all_shows()
         
         # Reschedule all active shows
         result = self.scheduler.schedule_all_active_shows()
@@ -139,38 +176,50 @@ class ScheduleManager:
         
         return result
     
-    def get_schedule_status(self) -> Dict[str, Any]:
+    def get_schedule_status(self, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Get current scheduling status
         
+        Args:
+            session: Optional open session to reuse instead of opening a new one
+            
         Returns:
             Dictionary with status information
         """
-        db = SessionLocal()
-        try:
-            # Get active shows from database
-            active_shows = db.query(Show).filter(Show.active == True).all()
+        with self._session(session) as db:
+            # Count active shows in SQL; scheduled ones are streamed below as plain rows
+            # with only the columns needed (no ORM objects, no full result list)
+            total_active_shows = db.execute(
+                select(func.count(Show.id)).where(Show.active == True)
+            ).scalar()
             
-            # Get scheduled jobs
-            scheduled_jobs = self.scheduler.get_scheduled_jobs()
+            # Get scheduled jobs (the jobstore is in-memory, so a scheduler that was never
+            # started in this process has none)
+            scheduled_jobs = self.scheduler.get_scheduled_jobs() if self._scheduler_started() else []
+            scheduled_ids = {job['show_id'] for job in scheduled_jobs}
             
             # Calculate statistics
-            total_active_shows = len(active_shows)
             total_scheduled_jobs = len(scheduled_jobs)
             
-            shows_with_schedule = len([s for s in active_shows if s.schedule_pattern])
-            shows_without_schedule = total_active_shows - shows_with_schedule
-            
+            shows_with_schedule = 0
             unscheduled_shows = []
-            for show in active_shows:
-                if show.schedule_pattern:
-                    job_exists = any(job['show_id'] == show.id for job in scheduled_jobs)
-                    if not job_exists:
-                        unscheduled_shows.append({
-                            'id': show.id,
-                            'name': show.name,
-                            'schedule_pattern': show.schedule_pattern
-                        })
+            scheduled_shows = db.execute(
+                select(Show.id, Show.name, Show.schedule_pattern).where(
+                    Show.active == True,
+                    Show.schedule_pattern.isnot(None),
+                    Show.schedule_pattern != ''
+                ).execution_options(yield_per=500)
+            )
+            for show in scheduled_shows:
+                shows_with_schedule += 1
+                if show.id not in scheduled_ids:
+                    unscheduled_shows.append({
+                        'id': show.id,
+                        'name': show.name,
+                        'schedule_pattern': show.schedule_pattern
+                    })
+            
+            shows_without_schedule = total_active_shows - shows_with_schedule
             
             return {
                 'success': True,
@@ -181,13 +230,11 @@ class ScheduleManager:
                 'unscheduled_shows': unscheduled_shows,
                 'scheduled_jobs': scheduled_jobs
             }
-            
-        finally:
-            db.close()
     
     def shutdown(self):
-        """Shutdown the scheduler"""
-        self.scheduler.shutdown()
+        """Shutdown the scheduler, if it was started"""
+        if self._scheduler_started():
+            self.scheduler.shutdown()
 
 def main():
     """Command line interface for schedule management"""
@@ -14,12 +14,38 @@ Inter-script Communication:
 """
 
 import re
+import functools
 from datetime import datetime, time
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from apscheduler.triggers.cron import CronTrigger
+
 logger = logging.getLogger(__name__)
 
+# Keywords for the fallback day patterns, matched as whole (optionally plural) words
+_EVERY_WORDS = frozenset(('every', 'daily', 'each'))
+_WEEKDAY_WORDS = frozenset(('weekday', 'workday'))
+_WEEKEND_WORDS = frozenset(('weekend',))
+_KEYWORD_RE = re.compile(
+    r'(?<![a-z])(' + '|'.join(sorted(_EVERY_WORDS | _WEEKDAY_WORDS | _WEEKEND_WORDS)) + r')s?(?![a-z])'
+)
+
+# days_map values that stand for a whole group of days
+_SPECIAL_DAYS = frozenset(('*', '1-5', '0,6'))
+
+# Cron day-of-week number -> day name
+_DAY_NAME_BY_NUM = {
+    '0': 'Sunday', '1': 'Monday', '2': 'Tuesday', '3': 'Wednesday',
+    '4': 'Thursday', '5': 'Friday', '6': 'Saturday'
+}
+
+# 24-hour hour -> (12-hour hour, AM/PM) for descriptions
+_HOUR12 = tuple(((h % 12) or 12, 'AM' if h < 12 else 'PM') for h in range(24))
+
+# Hours added when converting a 12-hour time (with 12 already folded to 0)
+_AMPM_OFFSET = {'am': 0, 'pm': 12}
+
 class ScheduleParser:
     """Converts natural language scheduling to cron expressions"""
     
@@ -41,29 +67,46 @@ class ScheduleParser:
             'everyday': '*'
         }
         
-        # Time parsing patterns
+        # Single-pass day tokenizer over lowercased text: whole words only (so "sun" doesn't
+        # match "sunny"), optionally plural ("mondays"), longest names first; case-insensitive
+        # so matches map straight back through days_map by their lowercased token
+        self._day_re = re.compile(
+            r'(?<![a-z])(' + '|'.join(map(re.escape, sorted(self.days_map, key=len, reverse=True)))
+            + r')s?(?![a-z])',
+            re.IGNORECASE
+        )
+        
+        # Time parsing patterns, compiled once and tried in priority order (parsers are
+        # static, so these hold plain functions rather than bound methods)
         self.time_patterns = [
             # Special cases
-            (r'\bnoon\b', self._parse_noon),
-            (r'\bmidnight\b', self._parse_midnight),
+            (re.compile(r'\bnoon\b', re.IGNORECASE), self._parse_noon),
+            (re.compile(r'\bmidnight\b', re.IGNORECASE), self._parse_midnight),
             # 12-hour format
-            (r'(\d{1,2}):(\d{2})\s*(am|pm)', self._parse_12hour),
-            (r'(\d{1,2})\s*(am|pm)', self._parse_12hour_no_minutes),
+            (re.compile(r'(\d{1,2}):(\d{2})\s*(am|pm)', re.IGNORECASE), self._parse_12hour),
+            (re.compile(r'(\d{1,2})\s*(am|pm)', re.IGNORECASE), self._parse_12hour_no_minutes),
             # 24-hour format
-            (r'(\d{1,2}):(\d{2})', self._parse_24hour),
-            (r'(\d{1,2})', self._parse_hour_only),
+            (re.compile(r'(\d{1,2}):(\d{2})'), self._parse_24hour),
+            (re.compile(r'(\d{1,2})'), self._parse_hour_only),
         ]
     
     def parse_schedule(self, schedule_text: str) -> Dict:
         """
         Parse natural language schedule into cron expression
         
+        Results are cached per schedule_text (parsing has no instance state), and each
+        call gets its own copy of the result dict.
+        
         Args:
             schedule_text: Natural language schedule description
             
         Returns:
             Dictionary with cron expression and human description
         """
+        return dict(_parse_schedule_cached(schedule_text))
+    
+    def _parse_schedule(self, schedule_text: str) -> Dict:
+        """Parse a schedule without the cache"""
         result = {
             'success': False,
             'cron_expression': None,
@@ -92,7 +135,7 @@ class ScheduleParser:
             cron_expression = f"{minute} {hour} * * {days}"
             
             # Generate human-readable description
-            description = self._generate_description(hour, minute, days, schedule_text)
+            description = self._generate_description(hour, minute, days)
             
             result.update({
                 'success': True,
@@ -109,7 +152,7 @@ class ScheduleParser:
     def _extract_time(self, schedule_text: str) -> Optional[Tuple[int, int]]:
         """Extract hour and minute from schedule text"""
         for pattern, parser in self.time_patterns:
-            match = re.search(pattern, schedule_text, re.IGNORECASE)
+            match = pattern.search(schedule_text)
             if match:
                 try:
                     return parser(match)
@@ -117,38 +160,39 @@ class ScheduleParser:
                     continue
         return None
     
-    def _parse_12hour(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_12hour(match) -> Tuple[int, int]:
         """Parse 12-hour time format with minutes"""
         hour = int(match.group(1))
         minute = int(match.group(2))
         ampm = match.group(3).lower()
         
-        if ampm == 'pm' and hour != 12:
-            hour += 12
-        elif ampm == 'am' and hour == 12:
+        if hour == 12:
             hour = 0
+        hour += _AMPM_OFFSET[ampm]
         
         if not (0 <= hour <= 23 and 0 <= minute <= 59):
             raise ValueError("Invalid time")
         
         return hour, minute
     
-    def _parse_12hour_no_minutes(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_12hour_no_minutes(match) -> Tuple[int, int]:
         """Parse 12-hour time format without minutes"""
         hour = int(match.group(1))
         ampm = match.group(2).lower()
         
-        if ampm == 'pm' and hour != 12:
-            hour += 12
-        elif ampm == 'am' and hour == 12:
+        if hour == 12:
             hour = 0
+        hour += _AMPM_OFFSET[ampm]
         
         if not (0 <= hour <= 23):
             raise ValueError("Invalid hour")
         
         return hour, 0
     
-    def _parse_24hour(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_24hour(match) -> Tuple[int, int]:
         """Parse 24-hour time format"""
         hour = int(match.group(1))
         minute = int(match.group(2))
@@ -158,7 +202,8 @@ class ScheduleParser:
         
         return hour, minute
     
-    def _parse_hour_only(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_hour_only(match) -> Tuple[int, int]:
         """Parse hour only (assume 24-hour format)"""
         hour = int(match.group(1))
         
@@ -167,36 +212,38 @@ class ScheduleParser:
         
         return hour, 0
     
-    def _parse_noon(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_noon(match) -> Tuple[int, int]:
         """Parse 'noon'"""
         return 12, 0
     
-    def _parse_midnight(self, match) -> Tuple[int, int]:
+    @staticmethod
+    def _parse_midnight(match) -> Tuple[int, int]:
         """Parse 'midnight'"""
         return 0, 0
     
     def _extract_days(self, schedule_text: str) -> Optional[str]:
         """Extract days of week from schedule text"""
         # Look for specific days
-        found_days = []
+        found_days = set()
         
-        for day_name, cron_value in self.days_map.items():
-            if day_name in schedule_text:
-                if cron_value in ['*', '1-5', '0,6']:
-                    return cron_value  # Special cases
-                else:
-                    found_days.append(cron_value)
+        for match in self._day_re.finditer(schedule_text):
+            cron_value = self.days_map[match.group(1).lower()]
+            if cron_value in _SPECIAL_DAYS:
+                return cron_value  # Special cases end the scan at the first one found
+            found_days.add(cron_value)
         
         if found_days:
             # Remove duplicates and sort
-            unique_days = sorted(set(found_days))
+            unique_days = sorted(found_days)
             return ','.join(unique_days)
         
         # Default patterns
-        if any(word in schedule_text for word in ['every', 'daily', 'each']):
-            if any(word in schedule_text for word in ['weekday', 'workday']):
+        keywords = set(_KEYWORD_RE.findall(schedule_text))
+        if keywords & _EVERY_WORDS:
+            if keywords & _WEEKDAY_WORDS:
                 return '1-5'  # Monday to Friday
-            elif any(word in schedule_text for word in ['weekend']):
+            elif keywords & _WEEKEND_WORDS:
                 return '0,6'  # Saturday and Sunday
             else:
                 return '*'  # Every day
@@ -204,23 +251,13 @@ class ScheduleParser:
         # If no days specified, assume every day
         return '*'
     
-    def _generate_description(self, hour: int, minute: int, days: str, original: str) -> str:
-        """Generate human-readable description"""
-        # Format time
-        if minute == 0:
-            time_str = f"{hour:02d}:00"
-        else:
-            time_str = f"{hour:02d}:{minute:02d}"
-        
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _generate_description(hour: int, minute: int, days: str) -> str:
+        """Generate human-readable description (cached per hour, minute and days)"""
         # Convert to 12-hour format for description
-        if hour == 0:
-            time_12hr = f"12:{minute:02d} AM"
-        elif hour < 12:
-            time_12hr = f"{hour}:{minute:02d} AM"
-        elif hour == 12:
-            time_12hr = f"12:{minute:02d} PM"
-        else:
-            time_12hr = f"{hour-12}:{minute:02d} PM"
+        hour_12, ampm = _HOUR12[hour]
+        time_12hr = f"{hour_12}:{minute:02d} {ampm}"
         
         # Format days
         if days == '*':
@@ -233,12 +270,10 @@ class ScheduleParser:
             # Map cron values back to day names
             day_numbers = days.split(',')
             day_names = []
-            day_map = {'0': 'Sunday', '1': 'Monday', '2': 'Tuesday', 
-                      '3': 'Wednesday', '4': 'Thursday', '5': 'Friday', '6': 'Saturday'}
             
             for num in day_numbers:
-                if num in day_map:
-                    day_names.append(day_map[num])
+                if num in _DAY_NAME_BY_NUM:
+                    day_names.append(_DAY_NAME_BY_NUM[num])
             
             if len(day_names) == 1:
                 days_str = f"every {day_names[0]}"
@@ -248,53 +283,19 @@ class ScheduleParser:
         return f"Record at {time_12hr} {days_str}"
     
     def validate_cron_expression(self, cron_expr: str) -> bool:
-        """Validate a cron expression"""
+        """Validate a cron expression (steps, ranges, lists and day/month names included)"""
         try:
-            parts = cron_expr.split()
-            if len(parts) != 5:
-                return False
-            
-            minute, hour, day, month, day_of_week = parts
-            
-            # Basic validation
-            if not self._validate_cron_field(minute, 0, 59):
-                return False
-            if not self._validate_cron_field(hour, 0, 23):
-                return False
-            if not self._validate_cron_field(day, 1, 31):
-                return False
-            if not self._validate_cron_field(month, 1, 12):
-                return False
-            if not self._validate_cron_field(day_of_week, 0, 6):
-                return False
-            
+            CronTrigger.from_crontab(cron_expr, timezone='UTC')
             return True
-            
         except Exception:
             return False
-    
-    def _validate_cron_field(self, field: str, min_val: int, max_val: int) -> bool:
-        """Validate a single cron field"""
-        if field == '*':
-            return True
-        
-        # Handle ranges and lists
-        for part in field.split(','):
-            if '-' in part:
-                try:
-                    start, end = part.split('-')
-                    if not (min_val <= int(start) <= max_val and min_val <= int(end) <= max_val):
-                        return False
-                except ValueError:
-                    return False
-            else:
-                try:
-                    if not (min_val <= int(part) <= max_val):
-                        return False
-                except ValueError:
-                    return False
-        
-        return True
+
+_shared_parser = ScheduleParser()
+
+@functools.lru_cache(maxsize=512)
+def _parse_schedule_cached(schedule_text: str) -> Dict:
+    """Parse a schedule with the shared parser, cached per schedule text"""
+    return _shared_parser._parse_schedule(schedule_text)
 
 def test_schedule_parser():
     """Test the schedule parser with various inputs"""
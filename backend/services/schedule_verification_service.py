@@ -24,17 +24,26 @@ Automatically checks station schedules for changes once per week
 import sys
 import os
 import logging
+import threading
+import functools
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import argparse
-import json
+
+import jellyfish  # Jaro-Winkler similarity for matching renamed shows
 
 # Add project root to path
 sys.path.insert(0, '/opt/radiograb')
 
+from sqlalchemy import lambda_stmt, or_, select, update
 from backend.config.database import SessionLocal
-from backend.models.station import Station, Show
+from backend.models.station import Station, Show, ScheduleChange
 from backend.services.js_calendar_parser import JavaScriptCalendarParser
 
 # Set up logging
@@ -44,6 +53,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_log_listener = None
+
+def configure_logging():
+    """
+    Hand this module's log records to a background thread that writes them with the
+    root handlers, so verification threads don't block on log I/O. Called by main();
+    call it after configuring root logging when running verification elsewhere.
+    """
+    global _log_listener
+    root_handlers = logging.getLogger().handlers
+    if _log_listener is not None or not root_handlers:
+        return
+    
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, *root_handlers, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+# Minimum Jaro-Winkler similarity for a parsed show name to match a differently named
+# existing show (e.g. "morning show!" -> "morning show")
+RENAME_SIMILARITY_THRESHOLD = 0.93
+
+# Stations verified concurrently. Each worker thread runs its own headless Chrome
+# (roughly 200-400 MB resident while a calendar page loads), so keep this small
+VERIFY_WORKERS = int(os.environ.get('SCHEDULE_VERIFY_WORKERS', '2'))
+
+@functools.lru_cache(maxsize=1024)
+def _schedule_pattern(start_time, days: Tuple[str, ...]) -> str:
+    """Schedule pattern stored on shows for a parsed start time and days (cached, since
+    many shows share the same slots)"""
+    return f"{start_time} on {', '.join(days)}"
+
+def _change_to_row(verified_at: datetime, station_id: int, change: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a verification change into a schedule_changes row"""
+    return {
+        'verified_at': verified_at,
+        'station_id': station_id,
+        'change_type': change['type'],
+        'show_name': change['show_name'],
+        'old_schedule': change.get('old_schedule'),
+        'new_schedule': change.get('new_schedule', change.get('schedule')),
+        'old_description': change.get('old_description'),
+        'new_description': change.get('new_description', change.get('description')),
+        'reason': change.get('reason')
+    }
+
+def _row_to_change(row: ScheduleChange) -> Dict[str, Any]:
+    """Rebuild a verification change from a schedule_changes row"""
+    if row.change_type == 'added':
+        return {'type': 'added', 'show_name': row.show_name,
+                'schedule': row.new_schedule, 'description': row.new_description}
+    if row.change_type == 'removed':
+        return {'type': 'removed', 'show_name': row.show_name,
+                'old_schedule': row.old_schedule, 'reason': row.reason}
+    return {'type': row.change_type, 'show_name': row.show_name,
+            'old_schedule': row.old_schedule, 'new_schedule': row.new_schedule,
+            'old_description': row.old_description, 'new_description': row.new_description}
+
 class ScheduleVerificationService:
     """
     Service to verify and update station schedules weekly
@@ -51,12 +120,13 @@ class ScheduleVerificationService:
     
     def __init__(self):
         self.parser = JavaScriptCalendarParser()
+        # Each parser drives its own WebDriver, so worker threads get their own parser
+        self._local = threading.local()
+        self._local.parser = self.parser
         self.verification_log_path = Path('/var/radiograb/logs/schedule_verification.log')
-        self.changes_log_path = Path('/var/radiograb/logs/schedule_changes.json')
         
         # Ensure log directory exists
         self.verification_log_path.parent.mkdir(parents=True, exist_ok=True)
-        self.changes_log_path.parent.mkdir(parents=True, exist_ok=True)
     
     def should_verify_station(self, station) -> bool:
         """
@@ -76,12 +146,56 @@ class ScheduleVerificationService:
         week_ago = datetime.now() - timedelta(days=7)
         return station.last_tested < week_ago
     
-    def verify_station_schedule(self, station_id: int) -> Dict[str, Any]:
+    def _get_parser(self) -> JavaScriptCalendarParser:
+        """Get the calendar parser for the current thread"""
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = JavaScriptCalendarParser()
+        return parser
+    
+    def _load_shows_bulk(self, db, station_ids: List[int]) -> Dict[int, List[Show]]:
+        """Load the shows of several stations in one query, grouped by station ID"""
+        shows_by_station = defaultdict(list)
+        if station_ids:
+            for show in db.query(Show).filter(Show.station_id.in_(station_ids)).all():
+                shows_by_station[show.station_id].append(show)
+        return shows_by_station
+    
+    def _match_renamed_shows(self, show_keys: List[str], existing_keys) -> Dict[str, str]:
+        """
+        Map parsed show names with no exact match to the most similar existing show name
+        that no parsed show matches exactly, so small renames update a show instead of
+        replacing it
+        """
+        unmatched_existing = sorted(set(existing_keys).difference(show_keys))
+        renamed = {}
+        for show_key in show_keys:
+            if show_key in existing_keys or show_key in renamed or not unmatched_existing:
+                continue
+            
+            best_key, best_score = None, RENAME_SIMILARITY_THRESHOLD
+            for existing_key in unmatched_existing:
+                score = jellyfish.jaro_winkler_similarity(show_key, existing_key)
+                if score > best_score:
+                    best_key, best_score = existing_key, score
+            
+            if best_key is not None:
+                renamed[show_key] = best_key
+                unmatched_existing.remove(best_key)
+        
+        return renamed
+    
+    def verify_station_schedule(self, station_id: int, station: Optional[Station] = None,
+                                existing_shows: Optional[List[Show]] = None,
+                                conditional: bool = True) -> Dict[str, Any]:
         """
         Verify and update a single station's schedule
         
         Args:
             station_id: Database ID of the station
+            station: Pre-loaded, detached Station (looked up when omitted)
+            existing_shows: Pre-loaded, detached shows of the station (looked up when omitted)
+            conditional: Skip parsing when the calendar page reports it is unchanged
             
         Returns:
             Dictionary with verification results
@@ -95,12 +209,19 @@ class ScheduleVerificationService:
             'shows_added': 0,
             'shows_removed': 0,
             'changes': [],
-            'errors': []
+            'errors': [],
+            'not_modified': False
         }
         
+        # Lookups below are lambda statements, so their SQL is built and cached once
         db = SessionLocal()
         try:
-            station = db.query(Station).filter(Station.id == station_id).first()
+            if station is not None:
+                db.add(station)
+            else:
+                station = db.execute(
+                    lambda_stmt(lambda: select(Station).where(Station.id == station_id))
+                ).scalars().first()
             if not station:
                 result['errors'].append(f"Station {station_id} not found")
                 return result
@@ -116,22 +237,62 @@ class ScheduleVerificationService:
             
             # Parse current schedule from station website
             try:
-                parsed_schedule = self.parser.parse_station_schedule(
+                # Ask the site whether the calendar changed since the last verification
+                validators = self._get_parser().check_calendar_modified(
+                    station.calendar_url,
+                    station.calendar_etag if conditional else None,
+                    station.calendar_last_modified if conditional else None
+                )
+                
+                if validators and validators['not_modified']:
+                    station.last_tested = datetime.now()
+                    station.last_test_result = 'success'
+                    station.last_test_error = None
+                    db.commit()
+                    
+                    result['success'] = True
+                    result['not_modified'] = True
+                    logger.info(f"Calendar for {result['station_name']} not modified since last verification")
+                    return result
+                
+                parsed_schedule = self._get_parser().parse_station_schedule(
                     station.calendar_url,
                     station.id
                 )
                 
                 if not parsed_schedule:
                     result['errors'].append("No shows found in current schedule")
+                    # Forget the validators so the next run parses the calendar again
+                    # instead of getting a 304 for an empty or broken schedule
+                    station.calendar_etag = None
+                    station.calendar_last_modified = None
+                    db.commit()
                     return result
                     
                 result['shows_found'] = len(parsed_schedule)
                 
+                # One timestamp for every change made by this verification
+                now = datetime.now()
+                
                 # Get existing shows for this station
-                existing_shows = {
-                    show.name.lower(): show 
-                    for show in db.query(Show).filter(Show.station_id == station_id).all()
-                }
+                if existing_shows is not None:
+                    db.add_all(existing_shows)
+                else:
+                    existing_shows = db.execute(
+                        lambda_stmt(lambda: select(Show).where(Show.station_id == station_id))
+                    ).scalars().all()
+                existing_shows = {show.name.lower(): show for show in existing_shows}
+                
+                # Shows whose name changed slightly are matched to their existing row
+                renamed_shows = self._match_renamed_shows(
+                    [show_data.name.strip().lower() for show_data in parsed_schedule
+                     if show_data.name and show_data.name.strip()],
+                    existing_shows
+                )
+                
+                # New and changed shows are collected and written together after the loop
+                new_shows = []
+                updated_shows = []
                 
                 # Process each show found in the schedule
                 for show_data in parsed_schedule:
@@ -140,49 +301,61 @@ class ScheduleVerificationService:
                         continue
                         
                     show_key = show_name.lower()
+                    renamed = show_key in renamed_shows
+                    if renamed:
+                        show_key = renamed_shows[show_key]
+                        logger.info("Matched %s to existing show %s", show_name, show_key)
                     # Convert ShowSchedule object to schedule pattern format
-                    schedule_pattern = f"{show_data.start_time} on {', '.join(show_data.days)}"
+                    schedule_pattern = _schedule_pattern(show_data.start_time, tuple(show_data.days))
                     schedule_description = show_data.description or ''
                     
                     if show_key in existing_shows:
                         # Update existing show if schedule changed
                         existing_show = existing_shows[show_key]
                         
-                        if existing_show.schedule_pattern != schedule_pattern:
+                        if existing_show.schedule_pattern != schedule_pattern or renamed:
                             old_pattern = existing_show.schedule_pattern
-                            existing_show.schedule_pattern = schedule_pattern
-                            existing_show.schedule_description = schedule_description
-                            existing_show.updated_at = datetime.now()
-                            
-                            result['shows_updated'] += 1
-                            result['changes'].append({
+                            show_update = {
+                                'id': existing_show.id,
+                                'schedule_pattern': schedule_pattern,
+                                'schedule_description': schedule_description,
+                                'updated_at': now
+                            }
+                            change = {
                                 'type': 'updated',
                                 'show_name': show_name,
                                 'old_schedule': old_pattern,
                                 'new_schedule': schedule_pattern,
                                 'old_description': existing_show.schedule_description,
                                 'new_description': schedule_description
-                            })
+                            }
+                            # Store the new name so the match isn't recomputed on every run
+                            if renamed:
+                                show_update['name'] = show_name
+                                change['reason'] = f"Renamed from {existing_show.name}"
+                            updated_shows.append(show_update)
                             
-                            logger.info(f"Updated schedule for {show_name}: {old_pattern} -> {schedule_pattern}")
+                            result['shows_updated'] += 1
+                            result['changes'].append(change)
+                            
+                            logger.info("Updated schedule for %s: %s -> %s", show_name, old_pattern, schedule_pattern)
                         
                         # Remove from existing_shows so we know it's still active
                         del existing_shows[show_key]
                         
                     else:
                         # Add new show (inactive by default - user must manually activate)
-                        new_show = Show(
-                            name=show_name,
-                            station_id=station_id,
-                            schedule_pattern=schedule_pattern,
-                            schedule_description=schedule_description,
-                            description=f"{station.name} program: {show_name}",
-                            active=False,  # Inactive by default - user decides what to activate
-                            created_at=datetime.now(),
-                            updated_at=datetime.now()
-                        )
+                        new_shows.append({
+                            'name': show_name,
+                            'station_id': station_id,
+                            'schedule_pattern': schedule_pattern,
+                            'schedule_description': schedule_description,
+                            'description': f"{station.name} program: {show_name}",
+                            'active': False,  # Inactive by default - user decides what to activate
+                            'created_at': now,
+                            'updated_at': now
+                        })
                         
-                        db.add(new_show)
                         result['shows_added'] += 1
                         result['changes'].append({
                             'type': 'added',
@@ -191,13 +364,20 @@ class ScheduleVerificationService:
                             'description': schedule_description
                         })
                         
-                        logger.info(f"Added new show: {show_name} with schedule {schedule_pattern}")
+                        logger.info("Added new show: %s with schedule %s", show_name, schedule_pattern)
+                
+                # Insert all new shows with a single batched INSERT, and update changed
+                # schedules with one executemany UPDATE by primary key
+                if new_shows:
+                    db.bulk_insert_mappings(Show, new_shows)
+                if updated_shows:
+                    db.bulk_update_mappings(Show, updated_shows)
                 
                 # Mark remaining shows as inactive (removed from schedule)
+                removed_ids = []
                 for show_name, show in existing_shows.items():
                     if show.active:  # Only deactivate if currently active
-                        show.active = False
-                        show.updated_at = datetime.now()
+                        removed_ids.append(show.id)
                         
                         result['shows_removed'] += 1
                         result['changes'].append({
@@ -207,10 +387,24 @@ class ScheduleVerificationService:
                             'reason': 'No longer found in station schedule'
                         })
                         
-                        logger.info(f"Deactivated show {show.name} - no longer in schedule")
+                        logger.info("Deactivated show %s - no longer in schedule", show.name)
+                
+                # Deactivate them all with a single UPDATE
+                if removed_ids:
+                    db.execute(
+                        update(Show)
+                        .where(Show.id.in_(removed_ids))
+                        .values(active=False, updated_at=now)
+                    )
                 
                 # Update station last_tested timestamp and result based on findings
-                station.last_tested = datetime.now()
+                station.last_tested = now
+                
+                # Remember the calendar's validators for the next conditional check, but
+                # only once shows were actually parsed from this version of the page
+                parsed_ok = validators and result['shows_found'] > 0
+                station.calendar_etag = validators['etag'] if parsed_ok else None
+                station.calendar_last_modified = validators['last_modified'] if parsed_ok else None
                 
                 if result['shows_found'] > 0:
                     station.last_test_result = 'success'
@@ -233,6 +427,8 @@ class ScheduleVerificationService:
                 station.last_tested = datetime.now()
                 station.last_test_result = 'error'
                 station.last_test_error = error_msg
+                station.calendar_etag = None
+                station.calendar_last_modified = None
                 db.commit()
                 
         except Exception as e:
@@ -244,12 +440,14 @@ class ScheduleVerificationService:
             
         return result
     
-    def verify_all_stations(self, force: bool = False) -> Dict[str, Any]:
+    def verify_all_stations(self, force: bool = False, max_workers: int = VERIFY_WORKERS) -> Dict[str, Any]:
         """
         Verify schedules for all stations that need checking
         
         Args:
             force: If True, verify all stations regardless of last check time
+            max_workers: Number of stations verified concurrently; each worker runs its
+                own headless Chrome, so memory use grows with this
             
         Returns:
             Dictionary with overall verification results
@@ -265,14 +463,33 @@ class ScheduleVerificationService:
         
         db = SessionLocal()
         try:
-            # Get all active stations
-            stations = db.query(Station).filter(Station.status == 'active').all()
+            # Get active stations; unless forced, only those due for verification
+            # (same rule as should_verify_station, applied in SQL)
+            stmt = lambda_stmt(lambda: select(Station).where(Station.status == 'active'))
+            if not force:
+                week_ago = datetime.now() - timedelta(days=7)
+                stmt += lambda s: s.where(or_(Station.last_tested.is_(None), Station.last_tested < week_ago))
+            stations_to_verify = db.execute(stmt).scalars().all()
             
-            for station in stations:
-                if force or self.should_verify_station(station):
-                    logger.info(f"Checking station: {station.name}")
-                    
-                    station_result = self.verify_station_schedule(station.id)
+            for station in stations_to_verify:
+                logger.info(f"Checking station: {station.name}")
+            
+            # Load every station's shows in one query, then detach the rows so each
+            # verification can attach its station's rows to its own session
+            shows_by_station = self._load_shows_bulk(db, [station.id for station in stations_to_verify])
+            db.expunge_all()
+            
+            # Verification is dominated by fetching station websites, so check stations
+            # concurrently; each verification uses its own database session
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self.verify_station_schedule, station.id, station,
+                                    shows_by_station[station.id], not force)
+                    for station in stations_to_verify
+                ]
+                
+                for future in as_completed(futures):
+                    station_result = future.result()
                     overall_result['station_results'].append(station_result)
                     overall_result['stations_checked'] += 1
                     
@@ -283,8 +500,6 @@ class ScheduleVerificationService:
                     if not station_result['success']:
                         overall_result['success'] = False
                         overall_result['errors'].extend(station_result['errors'])
-                else:
-                    logger.debug(f"Skipping {station.name} - checked recently")
             
             # Log results
             self.log_verification_results(overall_result)
@@ -300,57 +515,60 @@ class ScheduleVerificationService:
     
     def log_verification_results(self, results: Dict[str, Any]):
         """
-        Log verification results to files
+        Log the verification summary to a file and detailed changes to the database
         
         Args:
             results: Verification results dictionary
         """
         try:
-            # Log summary to text file
-            with open(self.verification_log_path, 'a') as f:
-                f.write(f"\n=== Schedule Verification - {datetime.now()} ===\n")
-                f.write(f"Stations checked: {results['stations_checked']}\n")
-                f.write(f"Stations with changes: {results['stations_with_changes']}\n")
-                f.write(f"Total changes: {results['total_changes']}\n")
-                f.write(f"Success: {results['success']}\n")
-                
-                if results['errors']:
-                    f.write("Errors:\n")
-                    for error in results['errors']:
-                        f.write(f"  - {error}\n")
-                
-                f.write("\nStation Details:\n")
-                for station_result in results['station_results']:
-                    f.write(f"  {station_result['station_name']}: ")
-                    f.write(f"Found {station_result['shows_found']} shows, ")
-                    f.write(f"Updated {station_result['shows_updated']}, ")
-                    f.write(f"Added {station_result['shows_added']}, ")
-                    f.write(f"Removed {station_result['shows_removed']}\n")
-                
-                f.write("\n")
+            # Log summary to text file, built in memory and appended with a single write on
+            # an O_APPEND descriptor so concurrent runs can't interleave their summaries
+            lines = [
+                f"\n=== Schedule Verification - {datetime.now()} ===\n",
+                f"Stations checked: {results['stations_checked']}\n",
+                f"Stations with changes: {results['stations_with_changes']}\n",
+                f"Total changes: {results['total_changes']}\n",
+                f"Success: {results['success']}\n"
+            ]
+            
+            if results['errors']:
+                lines.append("Errors:\n")
+                for error in results['errors']:
+                    lines.append(f"  - {error}\n")
+            
+            lines.append("\nStation Details:\n")
+            for station_result in results['station_results']:
+                lines.append(
+                    f"  {station_result['station_name']}: "
+                    f"Found {station_result['shows_found']} shows, "
+                    f"Updated {station_result['shows_updated']}, "
+                    f"Added {station_result['shows_added']}, "
+                    f"Removed {station_result['shows_removed']}\n"
+                )
+            
+            lines.append("\n")
             
-            # Log detailed changes to JSON file
+            fd = os.open(self.verification_log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, ''.join(lines).encode('utf-8'))
+            finally:
+                os.close(fd)
+            
+            # Record detailed changes in schedule_changes with one bulk insert
             if results['total_changes'] > 0:
-                change_log = {
-                    'timestamp': datetime.now().isoformat(),
-                    'summary': {
-                        'stations_checked': results['stations_checked'],
-                        'stations_with_changes': results['stations_with_changes'],
-                        'total_changes': results['total_changes']
-                    },
-                    'changes': []
-                }
+                verified_at = datetime.now()
+                rows = [
+                    _change_to_row(verified_at, station_result['station_id'], change)
+                    for station_result in results['station_results']
+                    for change in station_result['changes']
+                ]
                 
-                for station_result in results['station_results']:
-                    if station_result['changes']:
-                        change_log['changes'].append({
-                            'station_id': station_result['station_id'],
-                            'station_name': station_result['station_name'],
-                            'changes': station_result['changes']
-                        })
-                
-                with open(self.changes_log_path, 'a') as f:
-                    f.write(json.dumps(change_log, indent=2) + '\n')
+                db = SessionLocal()
+                try:
+                    db.bulk_insert_mappings(ScheduleChange, rows)
+                    db.commit()
+                finally:
+                    db.close()
                     
         except Exception as e:
             logger.error(f"Error logging verification results: {e}")
@@ -374,21 +592,47 @@ class ScheduleVerificationService:
         }
         
         try:
-            if self.changes_log_path.exists():
-                with open(self.changes_log_path, 'r') as f:
-                    cutoff_date = datetime.now() - timedelta(days=days)
-                    
-                    for line in f:
-                        try:
-                            log_entry = json.loads(line.strip())
-                            entry_date = datetime.fromisoformat(log_entry['timestamp'])
-                            
-                            if entry_date >= cutoff_date:
-                                history['verifications'].append(log_entry)
-                                history['total_changes'] += log_entry['summary']['total_changes']
-                        except (json.JSONDecodeError, KeyError, ValueError):
-                            continue
-                            
+            cutoff_date = datetime.now() - timedelta(days=days)
+            
+            db = SessionLocal()
+            try:
+                rows = db.execute(
+                    select(ScheduleChange, Station.name)
+                    .join(Station, ScheduleChange.station_id == Station.id)
+                    .where(ScheduleChange.verified_at >= cutoff_date)
+                    .order_by(ScheduleChange.verified_at, ScheduleChange.id)
+                ).all()
+            finally:
+                db.close()
+            
+            # Group changes into one entry per verification run, then per station
+            verifications = {}
+            for change, station_name in rows:
+                verification = verifications.get(change.verified_at)
+                if verification is None:
+                    verification = verifications[change.verified_at] = {
+                        'timestamp': change.verified_at.isoformat(),
+                        'summary': {'stations_with_changes': 0, 'total_changes': 0},
+                        'changes': {}
+                    }
+                
+                station_changes = verification['changes'].get(change.station_id)
+                if station_changes is None:
+                    station_changes = verification['changes'][change.station_id] = {
+                        'station_id': change.station_id,
+                        'station_name': station_name,
+                        'changes': []
+                    }
+                    verification['summary']['stations_with_changes'] += 1
+                
+                station_changes['changes'].append(_row_to_change(change))
+                verification['summary']['total_changes'] += 1
+            
+            for verification in verifications.values():
+                verification['changes'] = list(verification['changes'].values())
+                history['verifications'].append(verification)
+                history['total_changes'] += verification['summary']['total_changes']
+                
         except Exception as e:
             history['success'] = False
             history['error'] = str(e)
@@ -404,15 +648,18 @@ def main():
     parser.add_argument('--station-id', type=int, help='Verify specific station by ID')
     parser.add_argument('--history', type=int, default=30, help='Show verification history for N days')
     parser.add_argument('--daemon', action='store_true', help='Run as daemon service')
+    parser.add_argument('-j', '--jobs', type=int, default=VERIFY_WORKERS,
+                        help='Number of stations to verify concurrently (each runs its own headless Chrome)')
     
     args = parser.parse_args()
+    configure_logging()
     
     service = ScheduleVerificationService()
     
     try:
         if args.station_id:
             # Verify single station
-            result = service.verify_station_schedule(args.station_id)
+            result = service.verify_station_schedule(args.station_id, conditional=not args.force)
             print(f"=== Station Verification Results ===")
             print(f"Station: {result['station_name']}")
             print(f"Success: {result['success']}")
@@ -420,6 +667,8 @@ def main():
             print(f"Shows updated: {result['shows_updated']}")
             print(f"Shows added: {result['shows_added']}")
             print(f"Shows removed: {result['shows_removed']}")
+            if result['not_modified']:
+                print("Calendar unchanged since last verification")
             
             if result['changes']:
                 print("\nChanges:")
@@ -433,7 +682,7 @@ def main():
                     
         elif args.verify_all:
             # Verify all stations
-            result = service.verify_all_stations(args.force)
+            result = service.verify_all_stations(args.force, args.jobs)
             print(f"=== Overall Verification Results ===")
             print(f"Success: {result['success']}")
             print(f"Stations checked: {result['stations_checked']}")
@@ -458,7 +707,7 @@ def main():
         elif args.daemon:
             # Run as daemon (placeholder for future cron integration)
             logger.info("Starting schedule verification daemon")
-            result = service.verify_all_stations()
+            result = service.verify_all_stations(max_workers=args.jobs)
             logger.info(f"Daemon run completed: {result['stations_checked']} stations checked, {result['total_changes']} total changes")
             
         else:
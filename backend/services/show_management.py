@@ -23,16 +23,25 @@ Inter-script Communication:
 import sys
 import os
 import logging
+import functools
+from contextlib import contextmanager
+import heapq
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 import glob
 import pytz
 
 # Add project root to path
 sys.path.insert(0, '/opt/radiograb')
 
+from sqlalchemy import and_, case, func, update
+from sqlalchemy.orm import Session
 from backend.config.database import SessionLocal
 from backend.models.station import Show, Station, Recording
 from backend.services.recording_service import RecordingScheduler, EnhancedRecordingService
@@ -45,6 +54,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Show schedules are interpreted in station-local (Eastern) time
+EASTERN_TZ = pytz.timezone('America/New_York')
+
+# Test/manual recordings left in temp: *_test_*.mp3, *_test_*.mp3.mp3 (AAC converted
+# files) and *_manual_*.mp3
+_TEST_RE = re.compile(r'_(test|manual)_.*\.mp3(?:\.mp3)?$')
+
+# Stale test recordings deleted per batch by cleanup_test_recordings
+CLEANUP_BATCH_SIZE = 64
+
+# Cron day-of-week (0/7=Sunday) -> APScheduler day-of-week (0=Monday, 6=Sunday)
+_DOW_MAP = {str(cron_day): str((cron_day - 1) % 7) for cron_day in range(8)}
+
+def _convert_dow_token(token: str) -> str:
+    """Convert one cron day-of-week list item (a day or an a-b range) to APScheduler"""
+    token = token.strip()
+    if '-' not in token:
+        return _DOW_MAP[token]
+    
+    start, end = token.split('-')
+    converted_start, converted_end = _DOW_MAP[start.strip()], _DOW_MAP[end.strip()]
+    if converted_start <= converted_end:
+        return f"{converted_start}-{converted_end}"
+    
+    # Ranges starting on Sunday (e.g. 0-5) wrap in APScheduler numbering, so list the days
+    return ','.join(_DOW_MAP[str(cron_day)] for cron_day in range(int(start), int(end) + 1))
+
+@functools.lru_cache(maxsize=512)
+def _build_trigger(minute: str, hour: str, day: str, month: str, day_of_week: str,
+                   timezone) -> CronTrigger:
+    """Build a CronTrigger, cached since show schedules rarely change between calls"""
+    return CronTrigger(
+        minute=minute,
+        hour=hour,
+        day=day,
+        month=month,
+        day_of_week=day_of_week,
+        timezone=timezone
+    )
+
 class ShowManagementService:
     """
     Enhanced show management with schedule analysis and cleanup
@@ -55,31 +104,59 @@ class ShowManagementService:
         self.recording_service = EnhancedRecordingService()
         self.scheduler = RecordingScheduler(self.recording_service)
         
-    def get_next_recordings(self, limit: int = 10) -> List[Dict[str, Any]]:
+    @contextmanager
+    def session(self):
+        """Open a session to share across several calls, closed on exit"""
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    @contextmanager
+    def _session(self, session: Optional[Session] = None):
+        """Yield the caller's session, or a new one that is closed afterwards"""
+        if session is not None:
+            yield session
+            return
+        
+        with self.session() as db:
+            yield db
+    
+    def get_next_recordings(self, limit: int = 10,
+                            session: Optional[Session] = None) -> List[Dict[str, Any]]:
         """
         Get upcoming recordings based on show schedules
         
         Args:
             limit: Maximum number of upcoming recordings to return
+            session: Optional open session to reuse instead of opening a new one
             
         Returns:
             List of upcoming recordings with show and time information
         """
         upcoming = []
-        db = SessionLocal()
-        
-        try:
-            # Get all active shows with schedules
-            active_shows = db.query(Show).filter(
+        with self._session(session) as db:
+            # Get all active shows with schedules as plain rows, joining in the station name
+            active_shows = db.query(
+                Show.id,
+                Show.name,
+                Show.schedule_pattern,
+                Show.schedule_description,
+                Show.tags,
+                Show.station_id,
+                Station.name.label('station_name')
+            ).join(Station, Show.station_id == Station.id, isouter=True).filter(
                 Show.active == True,
                 Show.schedule_pattern.isnot(None)
             ).all()
             
             # Use timezone-aware datetime
-            eastern = pytz.timezone('America/New_York')
-            now = datetime.now(eastern)
+            now = datetime.now(EASTERN_TZ)
             
             logger.debug(f"Current time: {now} ({now.strftime('%A')})")
+            # Skip runs starting within the next minute - too soon to record
+            min_time = now + timedelta(seconds=60)
             
             for show in active_shows:
                 if not show.schedule_pattern:
@@ -94,82 +171,52 @@ class ShowManagementService:
                     minute, hour, day, month, day_of_week = cron_parts
                     
                     # Debug logging for troubleshooting
-                    logger.info(f"Processing show {show.id} ({show.name}): pattern={show.schedule_pattern}")
+                    logger.debug("Processing show %s (%s): pattern=%s", show.id, show.name, show.schedule_pattern)
                     
                     # APScheduler uses different day-of-week numbering than standard cron
                     # Standard cron: 0=Sunday, 1=Monday, ..., 6=Saturday  
                     # APScheduler: 0=Monday, 1=Tuesday, ..., 6=Sunday
                     # We need to convert from cron format to APScheduler format
-                    if day_of_week != '*':
-                        # Handle multiple days (e.g., "1,2,3,4,5")
-                        if ',' in day_of_week:
-                            cron_days = day_of_week.split(',')
-                            apscheduler_days = []
-                            for cron_day in cron_days:
-                                cron_day = int(cron_day.strip())
-                                # Convert: cron Sunday(0) -> APScheduler Sunday(6)
-                                #          cron Monday(1) -> APScheduler Monday(0)
-                                apscheduler_day = (cron_day - 1) % 7
-                                apscheduler_days.append(str(apscheduler_day))
-                            converted_day_of_week = ','.join(apscheduler_days)
-                        else:
-                            cron_day = int(day_of_week)
-                            # Convert single day
-                            converted_day_of_week = str((cron_day - 1) % 7)
-                    else:
+                    if day_of_week == '*':
                         converted_day_of_week = day_of_week
+                    elif len(day_of_week) == 1:
+                        # Single day - the common case
+                        converted_day_of_week = _DOW_MAP[day_of_week]
+                    else:
+                        # Handle ranges and multiple days (e.g., "1-5", "1,2,3,4,5", "1-3,5")
+                        converted_day_of_week = ','.join(
+                            _convert_dow_token(token) for token in day_of_week.split(',')
+                        )
                     
-                    logger.info(f"Show {show.id}: Converting cron day_of_week '{day_of_week}' to APScheduler '{converted_day_of_week}'")
+                    logger.debug("Show %s: Converting cron day_of_week '%s' to APScheduler '%s'",
+                                 show.id, day_of_week, converted_day_of_week)
                     
                     # Create trigger to find next run time
-                    trigger = CronTrigger(
-                        minute=minute,
-                        hour=hour,
-                        day=day,
-                        month=month,
-                        day_of_week=converted_day_of_week,
-                        timezone='America/New_York'
-                    )
+                    trigger = _build_trigger(minute, hour, day, month, converted_day_of_week,
+                                             EASTERN_TZ)
                     
-                    # Get next run time - ensure we get FUTURE runs only
-                    next_run = trigger.get_next_fire_time(None, now)
+                    # Get next run time at least 1 minute in the future
+                    next_run = trigger.get_next_fire_time(None, min_time)
                     
-                    logger.info(f"Show {show.id} ({show.name}) calculated next_run: {next_run}")
-                    
-                    # Additional validation: make sure this is actually in the future
-                    if next_run:
-                        # Ensure next_run is at least 1 minute in the future
-                        time_diff = (next_run - now).total_seconds()
-                        logger.info(f"Show {show.id} time_diff: {time_diff:.0f} seconds")
-                        
-                        if time_diff < 60:  # Less than 1 minute in future
-                            logger.info(f"Show {show.id} ({show.name}) next_run {next_run} is too soon (in {time_diff:.0f}s), getting next occurrence")
-                            # Get the occurrence after this one
-                            next_run = trigger.get_next_fire_time(next_run, next_run)
-                            if next_run:
-                                logger.info(f"Show {show.id} updated next_run: {next_run}")
+                    logger.debug("Show %s (%s) calculated next_run: %s", show.id, show.name, next_run)
                     
                     if next_run:
                         upcoming.append({
                             'show_id': show.id,
                             'show_name': show.name,
-                            'station_name': show.station.name if show.station else 'Unknown',
+                            'station_name': show.station_name or 'Unknown',
                             'station_id': show.station_id,
                             'next_run': next_run,
                             'schedule_description': show.schedule_description,
-                            'tags': show.tags.split(',') if hasattr(show, 'tags') and show.tags else []
+                            'tags': show.tags.split(',') if show.tags else []
                         })
                         
                 except Exception as e:
                     logger.warning(f"Error parsing schedule for show {show.id}: {e}")
                     continue
             
-            # Sort by next run time and limit results
-            upcoming.sort(key=lambda x: x['next_run'])
-            return upcoming[:limit]
-            
-        finally:
-            db.close()
+            # Earliest runs first, limited - no need to sort every show
+            return heapq.nsmallest(limit, upcoming, key=itemgetter('next_run'))
     
     def cleanup_test_recordings(self, max_age_hours: int = 4) -> Dict[str, Any]:
         """
@@ -191,35 +238,30 @@ class ShowManagementService:
         if not self.temp_dir.exists():
             return result
             
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        cutoff_ts = (datetime.now() - timedelta(hours=max_age_hours)).timestamp()
         
         try:
-            # Find all test recording files
-            test_patterns = [
-                '*_test_*.mp3',
-                '*_test_*.mp3.mp3',  # AAC converted files
-                '*_manual_*.mp3'     # Manual recordings also in temp
-            ]
-            
-            for pattern in test_patterns:
-                for file_path in self.temp_dir.glob(pattern):
-                    try:
-                        # Check file modification time
-                        file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+            # Scan and delete in bounded batches: each batch of stale files is unlinked
+            # in parallel (unlink latency dominates on network mounts) before the scan
+            # continues, so at most one batch of pending deletes is held at a time
+            stale_files = self._stale_test_recordings(cutoff_ts, result['errors'])
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                while True:
+                    batch = list(islice(stale_files, CLEANUP_BATCH_SIZE))
+                    if not batch:
+                        break
+                    
+                    for name, size, error in pool.map(self._delete_test_recording, batch):
+                        if error:
+                            error_msg = f"Error deleting {name}: {error}"
+                            result['errors'].append(error_msg)
+                            logger.error(error_msg)
+                            continue
                         
-                        if file_mtime < cutoff_time:
-                            file_size = file_path.stat().st_size
-                            file_path.unlink()
-                            
-                            result['files_deleted'] += 1
-                            result['bytes_freed'] += file_size
-                            
-                            logger.info(f"Deleted old test recording: {file_path.name}")
-                            
-                    except Exception as e:
-                        error_msg = f"Error deleting {file_path.name}: {str(e)}"
-                        result['errors'].append(error_msg)
-                        logger.error(error_msg)
+                        result['files_deleted'] += 1
+                        result['bytes_freed'] += size
+                        
+                        logger.info(f"Deleted old test recording: {name}")
                         
         except Exception as e:
             result['success'] = False
@@ -228,13 +270,50 @@ class ShowManagementService:
         
         return result
     
-    def toggle_show_active(self, show_id: int, active: bool) -> Dict[str, Any]:
+    def _stale_test_recordings(self, cutoff_ts: float,
+                               errors: List[str]) -> Iterator[Tuple[str, str, int]]:
+        """Yield (path, name, size) for test recordings last modified before cutoff_ts"""
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not _TEST_RE.search(name):
+                    continue
+                
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    
+                    # Check file modification time
+                    stat = entry.stat(follow_symlinks=False)
+                    
+                except OSError as e:
+                    error_msg = f"Error checking {name}: {str(e)}"
+                    errors.append(error_msg)
+                    logger.error(error_msg)
+                    continue
+                
+                if stat.st_mtime < cutoff_ts:
+                    yield entry.path, name, stat.st_size
+    
+    @staticmethod
+    def _delete_test_recording(stale_file: Tuple[str, str, int]) -> Tuple[str, int, Optional[str]]:
+        """Delete a file, returning (name, size, error) instead of raising"""
+        path, name, size = stale_file
+        try:
+            os.unlink(path)
+            return name, size, None
+        except OSError as e:
+            return name, size, str(e)
+    
+    def toggle_show_active(self, show_id: int, active: bool,
+                           session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Toggle show active/inactive status and update scheduler
         
         Args:
             show_id: Database ID of the show
             active: True to activate, False to deactivate
+            session: Optional open session to reuse instead of opening a new one
             
         Returns:
             Dictionary with operation results
@@ -245,49 +324,58 @@ class ShowManagementService:
             'error': None
         }
         
-        db = SessionLocal()
-        try:
-            show = db.query(Show).filter(Show.id == show_id).first()
-            if not show:
-                result['error'] = f"Show {show_id} not found"
-                return result
-            
-            old_status = show.active
-            show.active = active
-            db.commit()
+        with self._session(session) as db:
+            try:
+                # Update in place. MySQL has no UPDATE ... RETURNING, so activation loads the
+                # show for the scheduler with one primary-key SELECT afterwards
+                updated = db.execute(
+                    update(Show).where(Show.id == show_id).values(active=active)
+                ).rowcount
+                db.commit()
+                
+                if active:
+                    show = db.get(Show, show_id)
+                    found = show is not None
+                else:
+                    # Deactivation needs no row - the driver reports matched rows, so 0 means no such show
+                    show = None
+                    found = bool(updated)
+                if not found:
+                    result['error'] = f"Show {show_id} not found"
+                    return result
             
-            # Update scheduler
-            if active and show.schedule_pattern:
-                # Add to scheduler
-                schedule_result = self.scheduler.schedule_show(show_id)
-                if schedule_result['success']:
-                    result['message'] = f'Show activated and scheduled for recording'
+                # Update scheduler
+                if show is not None and show.schedule_pattern:
+                    # Add to scheduler, reusing the show loaded above
+                    schedule_result = self.scheduler.schedule_loaded_show(show)
+                    if schedule_result['success']:
+                        result['message'] = f'Show activated and scheduled for recording'
+                    else:
+                        result['message'] = f'Show activated but scheduling failed: {schedule_result["error"]}'
                 else:
-                    result['message'] = f'Show activated but scheduling failed: {schedule_result["error"]}'
-            else:
-                # Remove from scheduler
-                unschedule_result = self.scheduler.unschedule_show(show_id)
-                result['message'] = f'Show {"deactivated" if not active else "activated"} and {"removed from" if not active else "added to"} scheduler'
+                    # Remove from scheduler
+                    unschedule_result = self.scheduler.unschedule_show(show_id)
+                    result['message'] = f'Show {"deactivated" if not active else "activated"} and {"removed from" if not active else "added to"} scheduler'
             
-            result['success'] = True
-            logger.info(f"Show {show_id} status changed: {old_status} -> {active}")
+                result['success'] = True
+                logger.info(f"Show {show_id} status changed to {active}")
             
-        except Exception as e:
-            result['error'] = f"Database error: {str(e)}"
-            db.rollback()
-            logger.error(f"Error toggling show {show_id}: {e}")
-        finally:
-            db.close()
+            except Exception as e:
+                result['error'] = f"Database error: {str(e)}"
+                db.rollback()
+                logger.error(f"Error toggling show {show_id}: {e}")
             
         return result
     
-    def update_show_tags(self, show_id: int, tags: str) -> Dict[str, Any]:
+    def update_show_tags(self, show_id: int, tags: str,
+                         session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Update show tags
         
         Args:
             show_id: Database ID of the show
             tags: Comma-separated tags string
+            session: Optional open session to reuse instead of opening a new one
             
         Returns:
             Dictionary with operation results
@@ -298,54 +386,56 @@ class ShowManagementService:
             'error': None
         }
         
-        db = SessionLocal()
-        try:
-            show = db.query(Show).filter(Show.id == show_id).first()
-            if not show:
-                result['error'] = f"Show {show_id} not found"
-                return result
+        with self._session(session) as db:
+            try:
+                show = db.query(Show).filter(Show.id == show_id).first()
+                if not show:
+                    result['error'] = f"Show {show_id} not found"
+                    return result
             
-            # Clean and validate tags
-            if tags:
-                tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-                cleaned_tags = ','.join(tag_list)
-            else:
-                cleaned_tags = None
+                # Clean and validate tags
+                if tags:
+                    tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+                    cleaned_tags = ','.join(tag_list)
+                else:
+                    cleaned_tags = None
             
-            show.tags = cleaned_tags
-            db.commit()
+                show.tags = cleaned_tags
+                db.commit()
             
-            result['success'] = True
-            result['message'] = f'Tags updated for show {show.name}'
-            logger.info(f"Updated tags for show {show_id}: {cleaned_tags}")
+                result['success'] = True
+                result['message'] = f'Tags updated for show {show.name}'
+                logger.info(f"Updated tags for show {show_id}: {cleaned_tags}")
             
-        except Exception as e:
-            result['error'] = f"Database error: {str(e)}"
-            db.rollback()
-            logger.error(f"Error updating tags for show {show_id}: {e}")
-        finally:
-            db.close()
+            except Exception as e:
+                result['error'] = f"Database error: {str(e)}"
+                db.rollback()
+                logger.error(f"Error updating tags for show {show_id}: {e}")
             
         return result
     
-    def get_show_statistics(self) -> Dict[str, Any]:
+    def get_show_statistics(self, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Get comprehensive show statistics
         
+        Args:
+            session: Optional open session to reuse instead of opening a new one
+            
         Returns:
             Dictionary with show statistics
         """
-        db = SessionLocal()
-        try:
-            total_shows = db.query(Show).count()
-            active_shows = db.query(Show).filter(Show.active == True).count()
-            scheduled_shows = db.query(Show).filter(
-                Show.active == True,
-                Show.schedule_pattern.isnot(None)
-            ).count()
-            
-            # Get tag statistics
-            shows_with_tags = db.query(Show).filter(Show.tags.isnot(None)).count()
+        with self._session(session) as db:
+            # Count shows by status and tags in a single aggregate query
+            total_shows, active_shows, scheduled_shows, shows_with_tags = db.query(
+                func.count(Show.id),
+                func.sum(case((Show.active == True, 1), else_=0)),
+                func.sum(case((and_(Show.active == True, Show.schedule_pattern.isnot(None)), 1), else_=0)),
+                func.sum(case((Show.tags.isnot(None), 1), else_=0))
+            ).one()
+            # SUM() is NULL on an empty table
+            active_shows = int(active_shows or 0)
+            scheduled_shows = int(scheduled_shows or 0)
+            shows_with_tags = int(shows_with_tags or 0)
             
             # Get recent recordings
             recent_recordings = db.query(Recording).filter(
@@ -360,9 +450,6 @@ class ShowManagementService:
                 'shows_with_tags': shows_with_tags,
                 'recent_recordings_7days': recent_recordings
             }
-            
-        finally:
-            db.close()
     
     def shutdown(self):
         """Shutdown the scheduler"""
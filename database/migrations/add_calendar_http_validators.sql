@@ -0,0 +1,8 @@
+-- Add HTTP cache validators for station calendar pages
+-- schedule_verification_service.py stores the calendar page's ETag / Last-Modified after a
+-- successful verification and sends them back as If-None-Match / If-Modified-Since, so an
+-- unchanged calendar (304 Not Modified) is not fetched and parsed again
+
+ALTER TABLE stations
+ADD COLUMN calendar_etag VARCHAR(255) NULL COMMENT 'Calendar page ETag from last verification' AFTER calendar_parsing_method,
+ADD COLUMN calendar_last_modified VARCHAR(64) NULL COMMENT 'Calendar page Last-Modified from last verification' AFTER calendar_etag;
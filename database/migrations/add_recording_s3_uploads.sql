@@ -0,0 +1,26 @@
+-- Track which recordings have been uploaded to which S3 configuration
+-- Replaces scanning user_api_usage_log to find recordings still needing auto-upload
+
+CREATE TABLE IF NOT EXISTS recording_s3_uploads (
+    recording_id INT NOT NULL,
+    config_id INT NOT NULL,
+    remote_key VARCHAR(500) NULL COMMENT 'Object key the recording was uploaded as',
+    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (recording_id, config_id),
+    FOREIGN KEY (recording_id) REFERENCES recordings(id) ON DELETE CASCADE,
+    FOREIGN KEY (config_id) REFERENCES user_s3_configs(id) ON DELETE CASCADE,
+    INDEX idx_config_uploaded (config_id, uploaded_at)
+);
+
+-- Backfill from successful uploads already recorded in the usage log
+INSERT IGNORE INTO recording_s3_uploads (recording_id, config_id, uploaded_at)
+SELECT l.resource_id, c.id, MIN(l.created_at)
+FROM user_api_usage_log l
+JOIN user_s3_configs c ON c.api_key_id = l.api_key_id AND c.user_id = l.user_id
+JOIN recordings r ON r.id = l.resource_id
+WHERE l.service_type = 's3_storage'
+AND l.operation_type = 'upload'
+AND l.success = 1
+AND l.resource_type = 'recording'
+GROUP BY l.resource_id, c.id;
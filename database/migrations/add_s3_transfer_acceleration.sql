@@ -0,0 +1,5 @@
+-- Add S3 Transfer Acceleration opt-in to S3 configurations
+-- Only AWS S3 endpoints support acceleration, so it stays off unless enabled per config
+
+ALTER TABLE user_s3_configs
+ADD COLUMN transfer_acceleration BOOLEAN DEFAULT 0 COMMENT 'Use the S3 Transfer Acceleration endpoint (AWS only)' AFTER path_prefix;
@@ -0,0 +1,7 @@
+-- Add per-configuration multipart upload tuning to S3 configurations
+-- NULL keeps the service defaults (S3_MULTIPART_CHUNK_MB / S3_MAX_CONCURRENCY);
+-- e.g. 64 MB parts suit AWS S3, while some S3-compatible endpoints prefer 16 MB
+
+ALTER TABLE user_s3_configs
+ADD COLUMN multipart_chunk_mb INT NULL COMMENT 'Multipart part size in MB (NULL = service default)' AFTER transfer_acceleration,
+ADD COLUMN max_concurrency INT NULL COMMENT 'Parallel part uploads per file (NULL = service default)' AFTER multipart_chunk_mb;
@@ -0,0 +1,20 @@
+-- Add schedule_changes table for schedule verification history
+-- schedule_verification_service.py records every show added, updated or removed by a
+-- verification run here (one bulk insert per run) instead of in schedule_changes.json,
+-- and reads history back with an indexed range query on verified_at
+
+CREATE TABLE IF NOT EXISTS schedule_changes (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    verified_at TIMESTAMP NOT NULL COMMENT 'Time of the verification run',
+    station_id INT NOT NULL,
+    change_type VARCHAR(20) NOT NULL COMMENT 'added, updated, removed',
+    show_name VARCHAR(255) NOT NULL,
+    old_schedule VARCHAR(255) NULL,
+    new_schedule VARCHAR(255) NULL,
+    old_description VARCHAR(500) NULL,
+    new_description VARCHAR(500) NULL,
+    reason VARCHAR(255) NULL,
+    FOREIGN KEY (station_id) REFERENCES stations(id) ON DELETE CASCADE,
+    INDEX idx_verified_at (verified_at),
+    INDEX idx_station_id (station_id)
+);
@@ -0,0 +1,8 @@
+-- Add composite index for per-station show lookups by name
+-- Used by schedule_verification_service.py, which loads each station's shows and matches
+-- them by name. The column collation is case-insensitive, so this index also serves
+-- case-insensitive name comparisons within a station without a LOWER(name) expression index
+-- (stations.status is already covered by idx_status)
+
+ALTER TABLE shows
+ADD INDEX idx_station_name (station_id, name);
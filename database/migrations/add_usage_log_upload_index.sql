@@ -0,0 +1,7 @@
+-- Add covering index for S3 upload lookups in user_api_usage_log
+-- Used by s3_upload_service.py / s3_migration_service.py to find already-uploaded recordings
+-- resource_id already holds the recording ID as an INT, so lookups compare it directly
+-- instead of LIKE / SUBSTRING_INDEX string matching (which forced full table scans)
+
+ALTER TABLE user_api_usage_log
+ADD INDEX idx_upload_lookup (user_id, service_type, operation_type, success, resource_type, resource_id);
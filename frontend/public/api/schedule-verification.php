@@ -158,39 +158,76 @@ try {
             break;
             
         case 'get_recent_changes':
-            // Get recent schedule changes from the JSON log
-            $log_file = '/var/radiograb/logs/schedule_changes.json';
+            // Get recent schedule changes recorded by the verification service
             $days = min(intval($_GET['days'] ?? 7), 30);
             
+            $rows = $db->fetchAll("
+                SELECT sc.*, s.name AS station_name
+                FROM schedule_changes sc
+                JOIN stations s ON s.id = sc.station_id
+                WHERE sc.verified_at >= DATE_SUB(NOW(), INTERVAL ? DAY)
+                ORDER BY sc.verified_at DESC, sc.id
+            ", [$days]);
+            
+            // Group rows into one entry per verification run (newest first), then per station
             $changes = [];
             $total_changes = 0;
             
-            if (file_exists($log_file)) {
-                $cutoff_date = new DateTime();
-                $cutoff_date->sub(new DateInterval("P{$days}D"));
+            foreach ($rows as $row) {
+                $run = $row['verified_at'];
+                if (!isset($changes[$run])) {
+                    $changes[$run] = [
+                        'timestamp' => $run,
+                        'summary' => ['stations_with_changes' => 0, 'total_changes' => 0],
+                        'changes' => []
+                    ];
+                }
                 
-                $lines = file($log_file, FILE_IGNORE_NEW_LINES | FILE_SKIP_EMPTY_LINES);
+                $station_id = $row['station_id'];
+                if (!isset($changes[$run]['changes'][$station_id])) {
+                    $changes[$run]['changes'][$station_id] = [
+                        'station_id' => (int)$station_id,
+                        'station_name' => $row['station_name'],
+                        'changes' => []
+                    ];
+                    $changes[$run]['summary']['stations_with_changes']++;
+                }
                 
-                foreach ($lines as $line) {
-                    try {
-                        $log_entry = json_decode($line, true);
-                        $entry_date = new DateTime($log_entry['timestamp']);
-                        
-                        if ($entry_date >= $cutoff_date) {
-                            $changes[] = $log_entry;
-                            $total_changes += $log_entry['summary']['total_changes'];
-                        }
-                    } catch (Exception $e) {
-                        // Skip invalid JSON lines
-                        continue;
-                    }
+                if ($row['change_type'] === 'added') {
+                    $change = [
+                        'type' => 'added',
+                        'show_name' => $row['show_name'],
+                        'schedule' => $row['new_schedule'],
+                        'description' => $row['new_description']
+                    ];
+                } elseif ($row['change_type'] === 'removed') {
+                    $change = [
+                        'type' => 'removed',
+                        'show_name' => $row['show_name'],
+                        'old_schedule' => $row['old_schedule'],
+                        'reason' => $row['reason']
+                    ];
+                } else {
+                    $change = [
+                        'type' => $row['change_type'],
+                        'show_name' => $row['show_name'],
+                        'old_schedule' => $row['old_schedule'],
+                        'new_schedule' => $row['new_schedule'],
+                        'old_description' => $row['old_description'],
+                        'new_description' => $row['new_description']
+                    ];
                 }
+                
+                $changes[$run]['changes'][$station_id]['changes'][] = $change;
+                $changes[$run]['summary']['total_changes']++;
+                $total_changes++;
             }
             
-            // Sort by timestamp descending (newest first)
-            usort($changes, function($a, $b) {
-                return strcmp($b['timestamp'], $a['timestamp']);
-            });
+            foreach ($changes as &$entry) {
+                $entry['changes'] = array_values($entry['changes']);
+            }
+            unset($entry);
+            $changes = array_values($changes);
             
             echo json_encode([
                 'success' => true,
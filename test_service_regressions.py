@@ -0,0 +1,395 @@
+"""
+Tests service behaviour that depends on caching, batching and bulk database access.
+
+This script checks edge cases in the schedule verification, S3 upload, show
+management and schedule import services against an in-memory SQLite database and
+stub parsers/connections, so it runs without MySQL, S3 or a browser.
+
+Key Variables:
+- `DOW_CASES`: Cron day-of-week fields and the weekday each should next fire on.
+
+Inter-script Communication:
+- This script directly imports and tests `backend.services.schedule_verification_service.ScheduleVerificationService`.
+- It directly imports and tests `backend.services.s3_upload_service.S3UploadService` (stats flush and auto-upload).
+- It directly imports and tests `backend.services.s3_migration_service.S3MigrationService`.
+- It directly imports and tests `backend.services.show_management.ShowManagementService`.
+- It directly imports and tests `backend.services.schedule_importer.ScheduleImporter`.
+"""
+import sys
+sys.path.append('.')
+
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.config.database import Base
+from backend.models.station import Station, Show
+from backend.services.calendar_parser import ShowSchedule
+import backend.services.s3_migration_service as s3_migration_service
+import backend.services.s3_upload_service as s3_upload_service
+import backend.services.schedule_importer as schedule_importer
+import backend.services.schedule_verification_service as schedule_verification_service
+from backend.services.schedule_verification_service import ScheduleVerificationService
+from backend.services.show_management import ShowManagementService
+
+# Cron day-of-week field -> expected weekday of the next run (Monday=0 ... Sunday=6)
+DOW_CASES = {
+    '0': 6,   # cron Sunday
+    '7': 6,   # cron's alternate Sunday
+    '1': 0,   # single-character field
+    '6': 5,
+}
+
+def make_session_factory():
+    """Create an in-memory database with the RadioGrab tables"""
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+def add_stations(db):
+    db.add(Station(id=1, name='WAAA', website_url='https://waaa.example'))
+    db.add(Station(id=2, name='WBBB', website_url='https://wbbb.example'))
+    db.commit()
+
+class StubScheduler:
+    """Records scheduling calls instead of touching APScheduler"""
+    def __init__(self):
+        self.calls = []
+
+    def schedule_loaded_show(self, show):
+        self.calls.append(('schedule', show.id))
+        return {'success': True, 'error': None}
+
+    def unschedule_show(self, show_id):
+        self.calls.append(('unschedule', show_id))
+        return {'success': True}
+
+def make_show_service():
+    """ShowManagementService without the recording service and scheduler it builds"""
+    service = ShowManagementService.__new__(ShowManagementService)
+    service.temp_dir = Path('/nonexistent')
+    service.scheduler = StubScheduler()
+    return service
+
+def test_verify_parses_each_station():
+    """Stations sharing a calendar URL are each parsed with their own station id, and
+    calendar validators are kept only for a parse that found shows"""
+    print("=== Testing per-station calendar verification ===")
+
+    url = 'https://shared.example/schedule'
+    calls = []
+
+    class StubParser:
+        def check_calendar_modified(self, calendar_url, etag=None, last_modified=None):
+            return {'not_modified': False, 'etag': '"v2"', 'last_modified': None}
+
+        def parse_station_schedule(self, calendar_url, station_id):
+            calls.append((calendar_url, station_id))
+            if station_id == 2:
+                return []
+            return [ShowSchedule(name='Morning Show', start_time=time(6, 0), end_time=time(9, 0),
+                                 days=['monday'])]
+
+    Session = make_session_factory()
+    db = Session()
+    db.add(Station(id=1, name='WAAA', website_url='https://waaa.example', calendar_url=url))
+    db.add(Station(id=2, name='WBBB', website_url='https://wbbb.example', calendar_url=url,
+                   calendar_etag='"v1"'))
+    db.commit()
+    db.close()
+
+    service = ScheduleVerificationService.__new__(ScheduleVerificationService)
+    service._local = threading.local()
+    service._local.parser = StubParser()
+
+    original = schedule_verification_service.SessionLocal
+    schedule_verification_service.SessionLocal = Session
+    try:
+        first = service.verify_station_schedule(1)
+        second = service.verify_station_schedule(2)
+    finally:
+        schedule_verification_service.SessionLocal = original
+
+    assert calls == [(url, 1), (url, 2)], calls
+    assert first['success'] is True and first['shows_added'] == 1, first
+    assert second['errors'] == ['No shows found in current schedule'], second
+
+    db = Session()
+    assert db.get(Station, 1).calendar_etag == '"v2"'
+    # The empty parse forgets the old validators so the next run is not skipped by a 304
+    assert db.get(Station, 2).calendar_etag is None
+    db.close()
+    print("✅ Each station parsed with its own id, validators only kept for found shows")
+
+def test_flush_stats_requeues_on_failure():
+    """A failed flush must keep the pending batch for the next flush"""
+    print("\n=== Testing S3 upload stats flush failure ===")
+
+    written = []
+
+    class StubCursor:
+        def __init__(self, fail):
+            self.fail = fail
+        def __enter__(self):
+            return self
+        def __exit__(self, *args):
+            return False
+        def executemany(self, query, params):
+            if self.fail:
+                raise RuntimeError('database unavailable')
+            written.append(list(params))
+
+    class StubConnection:
+        def __init__(self, fail):
+            self.fail = fail
+        def cursor(self, *args):
+            return StubCursor(self.fail)
+        def commit(self):
+            pass
+        def rollback(self):
+            pass
+        def close(self):
+            pass
+
+    original = s3_upload_service.get_pooled_connection
+    service = s3_upload_service.S3UploadService()
+    try:
+        service._record_upload(1, 7, 3, 100, 5_000_000, 'recordings/a.mp3', 42)
+
+        s3_upload_service.get_pooled_connection = lambda: StubConnection(fail=True)
+        assert service.flush_stats() is False
+        assert dict(service._pending_stats) == {7: [100, 1]}
+        assert service._pending_recording_uploads == [(42, 7, 'recordings/a.mp3')]
+
+        # Uploads queued after the failure are written together with the kept batch
+        service._record_upload(1, 7, 3, 50, 5_000_000, 'recordings/b.mp3', 43)
+        s3_upload_service.get_pooled_connection = lambda: StubConnection(fail=False)
+        assert service.flush_stats() is True
+        assert dict(service._pending_stats) == {}
+        assert service._pending_recording_uploads == []
+        assert written[0] == [(150, 2, 7)]
+        assert written[2] == [(42, 7, 'recordings/a.mp3'), (43, 7, 'recordings/b.mp3')]
+    finally:
+        s3_upload_service.get_pooled_connection = original
+    print("✅ Failed batch kept and written by the next flush")
+
+def test_auto_upload_checks_each_config():
+    """A recording already in one bucket is still uploaded to the user's other configs"""
+    print("\n=== Testing auto-upload candidates per S3 config ===")
+
+    recorded_at = datetime(2025, 1, 1)
+    # config id -> recordings not yet uploaded to it
+    missing = {7: [1], 8: [1, 2]}
+
+    class StubCursor:
+        def __init__(self):
+            self.rows = []
+        def __enter__(self):
+            return self
+        def __exit__(self, *args):
+            return False
+        def execute(self, query, params=None):
+            if 'DISTINCT s3c.user_id' in query:
+                self.rows = [{'user_id': 5}]
+            else:
+                config_id, user_id = params
+                self.rows = [{'id': i, 'filename': f'{i}.mp3', 'recorded_at': recorded_at}
+                             for i in missing[config_id]]
+        def fetchall(self):
+            return self.rows
+
+    class StubConnection:
+        def cursor(self, *args):
+            return StubCursor()
+        def close(self):
+            pass
+
+    uploads = {}
+    original = s3_upload_service.get_pooled_connection
+    s3_upload_service.get_pooled_connection = StubConnection
+    try:
+        service = s3_upload_service.S3UploadService()
+        service.get_auto_upload_configs = lambda user_id: [{'id': 7}, {'id': 8}]
+        def upload(user_id, recording, configs):
+            uploads[recording['id']] = sorted(config['id'] for config in configs)
+            return {'success': True}
+        service._upload_recording_to_configs = upload
+        service.flush_stats = lambda: True
+
+        result = service.auto_upload_new_recordings()
+    finally:
+        s3_upload_service.get_pooled_connection = original
+
+    assert result['uploaded_count'] == 2, result
+    assert uploads == {1: [7, 8], 2: [8]}, uploads
+    print("✅ Each recording sent only to the configs missing it")
+
+def test_migration_caches_only_flushed_uploads():
+    """Migrated recordings enter the sync cache only after their upload records are written"""
+    print("\n=== Testing S3 migration sync cache ===")
+
+    class StubUploadService:
+        def __init__(self, flush_ok):
+            self.flush_ok = flush_ok
+        def get_user_s3_configs(self, user_id, active_only=True):
+            return [{'id': 7}]
+        def upload_file(self, user_id, local_path, remote_key, file_size=None, recording_id=None):
+            return {'success': True, 'remote_key': remote_key, 'upload_time': 0.1}
+        def flush_stats(self):
+            return self.flush_ok
+
+    with tempfile.TemporaryDirectory() as tmp:
+        recordings = []
+        for recording_id in (1, 2):
+            local_path = os.path.join(tmp, f'{recording_id}.mp3')
+            Path(local_path).write_bytes(b'x' * 100)
+            recordings.append({'id': recording_id, 'filename': f'{recording_id}.mp3', 'local_path': local_path,
+                               'file_size': 100, 'recorded_at': datetime(2025, 1, recording_id)})
+
+        cached = {}
+        for flush_ok in (False, True):
+            service = s3_migration_service.S3MigrationService.__new__(s3_migration_service.S3MigrationService)
+            service.s3_service = StubUploadService(flush_ok)
+            service.sync_cache = s3_migration_service.SyncStatusCache(os.path.join(tmp, f'{flush_ok}.sqlite'))
+            service.get_user_recordings = lambda user_id: recordings
+            service._load_migrated_ids = lambda user_id: set()
+
+            result = service.migrate_user_recordings(5, max_workers=2)
+            assert result['migrated'] == 2, result
+            cached[flush_ok] = service.sync_cache.get_migrated_ids(5)
+
+    assert cached == {False: set(), True: {1, 2}}, cached
+    print("✅ Failed flush leaves the sync cache untouched")
+
+def test_next_recordings_day_of_week():
+    """Cron day-of-week fields convert to the right APScheduler weekday"""
+    print("\n=== Testing next recordings day-of-week handling ===")
+
+    Session = make_session_factory()
+    db = Session()
+    add_stations(db)
+    for show_id, dow in enumerate(DOW_CASES, 1):
+        db.add(Show(id=show_id, station_id=1, name=f'Dow {dow}', schedule_pattern=f'0 12 * * {dow}',
+                    active=True))
+    db.add(Show(id=10, station_id=2, name='Mon Wed', schedule_pattern='30 8 * * 1,3', active=True))
+    db.add(Show(id=11, station_id=2, name='Weekdays', schedule_pattern='0 9 * * 1-5', active=True))
+    db.add(Show(id=13, station_id=2, name='Sun-Fri', schedule_pattern='0 10 * * 0-5', active=True))
+    db.add(Show(id=14, station_id=2, name='Weekends', schedule_pattern='0 11 * * 1-2,6-7', active=True))
+    db.add(Show(id=12, station_id=2, name='Inactive', schedule_pattern='0 9 * * *', active=False))
+    db.commit()
+
+    service = make_show_service()
+    upcoming = {r['show_id']: r for r in service.get_next_recordings(limit=20, session=db)}
+
+    for show_id, (dow, weekday) in enumerate(DOW_CASES.items(), 1):
+        next_run = upcoming[show_id]['next_run']
+        assert next_run.weekday() == weekday, (dow, next_run)
+        assert (next_run.hour, next_run.minute) == (12, 0)
+        print(f"✅ '{dow}' -> {next_run.strftime('%A %H:%M')}")
+
+    assert upcoming[10]['next_run'].weekday() in (0, 2)
+    assert upcoming[10]['station_name'] == 'WBBB'
+    # Ranges (as ScheduleParser emits for weekday shows) convert endpoint by endpoint,
+    # including ranges starting on Sunday and ranges inside lists
+    assert upcoming[11]['next_run'].weekday() in range(5), upcoming[11]['next_run']
+    assert upcoming[13]['next_run'].weekday() != 5, upcoming[13]['next_run']
+    assert upcoming[14]['next_run'].weekday() in (0, 1, 5, 6), upcoming[14]['next_run']
+    # Inactive shows are not listed
+    assert 12 not in upcoming
+
+    runs = [r['next_run'] for r in service.get_next_recordings(limit=3, session=db)]
+    assert len(runs) == 3 and runs == sorted(runs)
+    db.close()
+    print("✅ Lists and limits sorted by next run")
+
+def test_toggle_show_active_missing_show():
+    """Toggling an unknown show reports not found and touches no scheduler job"""
+    print("\n=== Testing show toggle ===")
+
+    Session = make_session_factory()
+    db = Session()
+    add_stations(db)
+    db.add(Show(id=1, station_id=1, name='Morning', schedule_pattern='0 7 * * 1', active=False))
+    db.commit()
+
+    service = make_show_service()
+
+    result = service.toggle_show_active(99, True, session=db)
+    assert result['success'] is False
+    assert result['error'] == 'Show 99 not found'
+    assert service.scheduler.calls == []
+
+    # Setting the status it already has still matches the row
+    result = service.toggle_show_active(1, False, session=db)
+    assert result['success'] is True, result
+
+    result = service.toggle_show_active(1, True, session=db)
+    assert result['success'] is True, result
+    assert db.get(Show, 1).active is True
+    assert service.scheduler.calls == [('unschedule', 1), ('schedule', 1)]
+    db.close()
+    print("✅ Unknown show rejected, known show toggled and scheduled")
+
+def test_schedule_importer_name_matching():
+    """Selected and existing shows match case- and whitespace-insensitively"""
+    print("\n=== Testing schedule importer name matching ===")
+
+    Session = make_session_factory()
+    db = Session()
+    add_stations(db)
+    db.add(Show(id=1, station_id=1, name='Morning Show', schedule_pattern='0 6 * * 1', active=True))
+    db.add(Show(id=2, station_id=2, name='Jazz Hour', schedule_pattern='0 20 * * 0', active=True))
+    db.commit()
+    db.close()
+
+    parsed = [
+        ShowSchedule(name='MORNING SHOW', start_time=time(6, 0), end_time=time(9, 0), days=['monday']),
+        ShowSchedule(name='Jazz Hour', start_time=time(20, 0), end_time=time(21, 0), days=['sunday']),
+        ShowSchedule(name='Jazz Hour', start_time=time(20, 0), end_time=time(21, 0), days=['saturday']),
+        ShowSchedule(name='News', start_time=time(12, 0), end_time=time(12, 30), days=['friday']),
+    ]
+
+    class StubCalendarParser:
+        def parse_station_schedule(self, url, station_id):
+            return list(parsed)
+
+    original = schedule_importer.SessionLocal
+    schedule_importer.SessionLocal = Session
+    try:
+        importer = schedule_importer.ScheduleImporter()
+        importer.calendar_parser = StubCalendarParser()
+
+        selected = [{'name': ' morning show '}, {'name': 'jazz hour'}]
+        results = importer.import_station_schedule(1, selected_shows=selected)
+    finally:
+        schedule_importer.SessionLocal = original
+
+    # 'MORNING SHOW' matches the existing show; the other station's 'Jazz Hour' does not,
+    # and its repeated entry is created once
+    assert results['shows_found'] == 3, results
+    assert results['shows_skipped'] == 2, results
+    assert results['shows_created'] == 1, results
+    assert results['errors'] == 0, results
+
+    db = Session()
+    names = sorted(show.name for show in db.query(Show).filter(Show.station_id == 1))
+    db.close()
+    assert names == ['Jazz Hour', 'Morning Show'], names
+    print("✅ Selection, existing-show matching and duplicates handled")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    test_verify_parses_each_station()
+    test_flush_stats_requeues_on_failure()
+    test_auto_upload_checks_each_config()
+    test_migration_caches_only_flushed_uploads()
+    test_next_recordings_day_of_week()
+    test_toggle_show_active_missing_show()
+    test_schedule_importer_name_matching()